@@ -7,12 +7,14 @@ from app.urls import register_blueprints
 from app.utils.jwt_handlers import register_jwt_error_handlers
 from app.celery_app import make_celery
 from app.utils.exceptions import handle_error
+from app.utils.json_provider import OrjsonProvider
 
 
 def create_app():
     """Factory function to create and configure the Flask application"""
     app = Flask(__name__)  # Create Flask app instance
     app.config.from_object(Config)  # Load configuration from config.py
+    app.json = OrjsonProvider(app)  # Use orjson for JSON parsing/serialization
 
     # Initialize Flask extensions
     db.init_app(app)  # Initialize SQLAlchemy
@@ -22,14 +22,52 @@ def make_celery(app=None):
     )
 
     # Configure Celery
+    # msgpack encodes faster and produces smaller payloads than stdlib json;
+    # json stays in accept_content so in-flight tasks survive the rollout
     celery.conf.update(
-        task_serializer="json",
-        accept_content=["json"],
-        result_serializer="json",
+        task_serializer="msgpack",
+        accept_content=["msgpack", "json"],
+        result_serializer="msgpack",
         timezone="UTC",
         task_track_started=True,
         worker_max_tasks_per_child=1000,
+        # SMTP/DB tasks have highly variable latency; the default prefetch
+        # of 4 lets a worker stuck on a slow send hoard tasks while other
+        # workers idle, so reserve only one task per process
+        worker_prefetch_multiplier=1,
         task_acks_late=True,
+        # With late acks, requeue tasks whose worker dies mid-send so no
+        # email is silently dropped
+        task_reject_on_worker_lost=True,
+        # SMTP tasks are pure I/O waits: route them to a dedicated "mail"
+        # queue so they can run under an eventlet pool, e.g.
+        #   celery -A celery_worker.celery worker -P eventlet -c 50 -Q mail
+        task_routes={
+            "send_verification_email": {"queue": "mail"},
+            "send_password_reset_email": {"queue": "mail"},
+            "send_email_change_otps": {"queue": "mail"},
+            "send_staff_email_change_verification": {"queue": "mail"},
+            # The deletion sweeps are latency-insensitive but DB-heavy; a
+            # separate queue keeps them off the workers serving OTP sends,
+            # e.g. celery -A celery_worker.celery worker -Q cleanup -c 1
+            "delete_user_objects": {"queue": "cleanup"},
+            "purge_expired_access_tokens": {"queue": "cleanup"},
+        },
+        beat_schedule={
+            "purge-expired-access-tokens": {
+                "task": "purge_expired_access_tokens",
+                "schedule": 3600.0,
+            },
+        },
+        # Bound Redis broker connections so bursty .delay() calls reuse a
+        # warm pool instead of spawning sockets until "max clients reached"
+        broker_pool_limit=10,
+        broker_connection_max_retries=3,
+        redis_max_connections=20,
+        broker_transport_options={
+            "socket_keepalive": True,
+            "health_check_interval": 30,
+        },
     )
 
     class ContextTask(celery.Task):
@@ -7,16 +7,24 @@ from flask_mail import Mail
 import redis
 import os
 
-
 db = SQLAlchemy()
 migrate = Migrate()
 jwt = JWTManager()
 bcrypt = Bcrypt()
 ma = Marshmallow()
 mail = Mail()
-redis_client = redis.StrictRedis(
+# Shared connection pool so every redis_client call reuses warm TCP
+# connections (one handshake/AUTH per connection, not per command).
+# BlockingConnectionPool makes bursts wait briefly for a free connection
+# instead of erroring out, and the health check pings idle connections so
+# a stale one is replaced rather than failing mid-request.
+redis_pool = redis.BlockingConnectionPool(
     host=os.getenv("REDIS_HOST", "localhost"),
     port=int(os.getenv("REDIS_PORT", 6379)),
     db=int(os.getenv("REDIS_DB", 0)),
+    max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", 50)),
+    timeout=10,
+    health_check_interval=30,
     decode_responses=True,
 )
+redis_client = redis.StrictRedis(connection_pool=redis_pool)
@@ -1,16 +1,27 @@
 from app.extensions import db
-import uuid
 from datetime import datetime, timezone
 
 
 class ActiveAccessToken(db.Model):
     __tablename__ = "active_access_tokens"
 
+    __table_args__ = (
+        # Backs the per-user token purges (password update, logout-all):
+        # without it each purge scans the whole token table
+        db.Index("ix_active_tokens_user", "user_id"),
+        # Backs the hourly expired-token sweep (range scan on age)
+        db.Index("ix_active_tokens_created_at", "created_at"),
+    )
+
     def utc_now():
         """Return the current UTC time with timezone awareness"""
         return datetime.now(timezone.utc)
 
-    id = db.Column(db.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = db.Column(
+        db.UUID(as_uuid=True),
+        primary_key=True,
+        server_default=db.text("gen_random_uuid()"),
+    )
     access_token = db.Column(db.String(500), unique=True, nullable=False)
     user_id = db.Column(
         db.UUID(as_uuid=True),
@@ -20,9 +31,8 @@ class ActiveAccessToken(db.Model):
     created_at = db.Column(db.DateTime, default=utc_now)
 
     # Define relationship with User
-    user = db.relationship(
-        "User", backref=db.backref("tokens", lazy=True, cascade="all, delete")
-    )
+    user = db.relationship("User", back_populates="tokens")
 
     def __repr__(self):
-        return f"Token for {self.user.username}"
+        # Use user_id so repr never triggers a lazy load of the user relationship
+        return f"<Token {self.id} user={self.user_id}>"
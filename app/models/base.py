@@ -1,25 +1,69 @@
-import uuid
 from ..extensions import db
-from datetime import datetime,timezone
+from datetime import datetime, timezone
+from sqlalchemy import event
+from sqlalchemy.orm import Session, with_loader_criteria
+
 
 class BaseModel(db.Model):
     """Base model with default fields"""
-    
-    __abstract__ = True 
-    
+
+    __abstract__ = True
+
     def utc_now():
         """Return the current UTC time with timezone awareness"""
         return datetime.now(timezone.utc)
-    
-    id = db.Column(db.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Ids are generated server-side: Postgres fills them in one round-trip
+    # instead of Python calling os.urandom(16) per row on bulk inserts
+    id = db.Column(
+        db.UUID(as_uuid=True),
+        primary_key=True,
+        server_default=db.text("gen_random_uuid()"),
+    )
     is_deleted = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=utc_now)
     updated_at = db.Column(db.DateTime, default=utc_now, onupdate=utc_now)
-    
-    
-    def delete(self):
-        """Soft delete the instance."""
+
+    def delete(self, commit=True):
+        """Soft delete the instance.
+
+        Pass commit=False when deleting several instances in one request so
+        the caller can commit once instead of once per row.
+        """
         self.is_deleted = True
-        db.session.commit()
+        if commit:
+            db.session.commit()
+
+    @classmethod
+    def bulk_soft_delete(cls, query):
+        """Soft delete every row matched by the query with a single UPDATE.
+
+        Emits one set-based UPDATE instead of a round-trip per row; the
+        caller is responsible for committing.
+        """
+        return query.update({cls.is_deleted: True}, synchronize_session=False)
+
 
+@event.listens_for(Session, "do_orm_execute")
+def _filter_soft_deleted(execute_state):
+    """Auto-apply ``is_deleted == False`` to every ORM SELECT.
 
+    Repeating the filter at each call site is both verbose and fragile
+    (forgetting it is a correctness bug), and the scattered hand-written
+    expressions defeat SQLAlchemy's compiled-statement cache. Queries that
+    genuinely need deleted rows opt out with
+    ``.execution_options(include_deleted=True)``.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                BaseModel,
+                lambda cls: cls.is_deleted == False,
+                include_aliases=True,
+            )
+        )
@@ -8,6 +8,23 @@ class Category(BaseModel):
     """Category model to store categories of transactions"""
 
     __tablename__ = "categories"
+    __table_args__ = (
+        # Partial index for the soft-delete list hot path: only live rows are
+        # indexed, matching the is_deleted=False filter on every list query
+        db.Index(
+            "ix_categories_active",
+            "user_id",
+            postgresql_where=db.text("is_deleted = false"),
+        ),
+        # Backs the uniqueness probe on create/update: names are stored
+        # normalized (lowercase), so the equality lookup can use this index
+        db.Index(
+            "ix_categories_user_name",
+            "user_id",
+            "name",
+            postgresql_where=db.text("is_deleted = false"),
+        ),
+    )
 
     name = db.Column(db.String(cat_name_len), nullable=False)
     user_id = db.Column(
@@ -18,8 +35,9 @@ class Category(BaseModel):
     is_predefined = db.Column(db.Boolean, default=False)
 
     # Define relationship with User
-    user = db.relationship(
-        "User", backref=db.backref("categories", lazy="select", cascade="all, delete")
+    user = db.relationship("User", back_populates="categories")
+    transactions = db.relationship(
+        "Transaction", back_populates="category", lazy="raise"
     )
 
     def __repr__(self):
@@ -8,6 +8,34 @@ class Transaction(BaseModel):
     """Transaction model to store financial transactions"""
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Supports the "is this category still in use" EXISTS probe
+        db.Index("ix_tx_category_active", "category_id", "is_deleted"),
+        # Partial index for the soft-delete list hot path: only live rows are
+        # indexed, matching the is_deleted=False filter on every list query
+        db.Index(
+            "ix_transactions_active",
+            "user_id",
+            db.text("date_time DESC"),
+            postgresql_where=db.text("is_deleted = false"),
+        ),
+        # Category-filtered listings for a user hit this pair directly
+        db.Index(
+            "ix_transactions_user_category",
+            "user_id",
+            "category_id",
+            postgresql_where=db.text("is_deleted = false"),
+        ),
+        # Covering index for the report aggregations: INCLUDE carries the
+        # aggregated columns so Postgres answers without heap lookups
+        db.Index(
+            "ix_transactions_report",
+            "user_id",
+            "date_time",
+            postgresql_include=["type", "amount", "category_id"],
+            postgresql_where=db.text("is_deleted = false"),
+        ),
+    )
 
     user_id = db.Column(
         db.UUID(as_uuid=True),
@@ -15,7 +43,13 @@ class Transaction(BaseModel):
         nullable=False,
     )
     type = db.Column(
-        db.Enum(TransactionType),
+        # Stored as a plain VARCHAR + CHECK instead of a native Postgres
+        # enum: values round-trip as strings with no enum OID handling
+        db.Enum(
+            TransactionType,
+            native_enum=False,
+            values_callable=lambda e: [i.value for i in e],
+        ),
         nullable=False,
     )
     category_id = db.Column(
@@ -30,12 +64,9 @@ class Transaction(BaseModel):
     description = db.Column(db.Text, nullable=True)
 
     # Define relationships
-    user = db.relationship(
-        "User", backref=db.backref("transactions", lazy=True, cascade="all, delete")
-    )
-    category = db.relationship(
-        "Category", backref=db.backref("transactions", lazy=True, cascade="all, delete")
-    )
+    user = db.relationship("User", back_populates="transactions")
+    category = db.relationship("Category", back_populates="transactions")
 
     def __repr__(self):
-        return f"<Transaction {self.user.username} - {self.type.value} - {self.amount}>"
+        # Use user_id so repr never triggers a lazy load of the user relationship
+        return f"<Transaction {self.user_id} - {self.type.value} - {self.amount}>"
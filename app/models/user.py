@@ -8,6 +8,17 @@ class User(BaseModel):
 
     __tablename__ = "users"
 
+    __table_args__ = (
+        # Backs keyset pagination of the staff users list: pages are range
+        # scans on (created_at DESC, id DESC) over live rows only
+        db.Index(
+            "ix_users_active_created",
+            db.text("created_at DESC"),
+            db.text("id DESC"),
+            postgresql_where=db.text("is_deleted = false"),
+        ),
+    )
+
     username = db.Column(db.String(120), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
     password = db.Column(db.String(255), nullable=False)
@@ -15,10 +26,18 @@ class User(BaseModel):
     is_staff = db.Column(db.Boolean, default=False)
     is_verified = db.Column(db.Boolean, default=False)
 
+    # Collections are declared with lazy="raise" so an accidental lazy load
+    # (an N+1 in disguise) fails loudly instead of emitting a hidden SELECT.
+    # No delete cascade: children are soft deleted by the explicit cleanup
+    # paths, and a session.delete(user) must never hard-delete them row by row.
+    categories = db.relationship("Category", back_populates="user", lazy="raise")
+    transactions = db.relationship("Transaction", back_populates="user", lazy="raise")
+    tokens = db.relationship("ActiveAccessToken", back_populates="user", lazy="raise")
+
     def set_password(self, password):
         """Hashes and sets the password."""
         self.password = bcrypt.generate_password_hash(password).decode("utf-8")
-        logger.info(f"Password set for user {self.email}")
+        logger.info("Password set for user %s", self.email)
 
     def check_password(self, password):
         """Checks the hashed password."""
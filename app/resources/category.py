@@ -12,14 +12,18 @@ from app.schemas.category import (
     categories_schema,
     category_update_schema,
 )
-from app.services.category import get_user_categories
+from app.services.category import (
+    get_user_categories,
+    get_predefined_categories,
+    invalidate_predefined_categories,
+)
 from app.utils.permissions import (
     authenticated_user,
     object_permission,
     category_permission,
 )
 from app.utils.responses import validation_error_response
-from app.utils.pagination import paginate
+from app.utils.pagination import paginate, paginate_list
 from app.utils.validators import normalize_category_name
 from app.utils.logger import logger
 
@@ -35,15 +39,26 @@ class CategoryListResource(Resource):
         user = g.user
         query_params = {
             "user_id": request.args.get("user_id"),
+            "is_predefined": request.args.get("is_predefined"),
         }
 
+        # The predefined set is global and stable - serve it from the Redis
+        # cache without touching Postgres
+        if (query_params["is_predefined"] or "").lower() in (
+            "true",
+            "1",
+        ) and not query_params["user_id"]:
+            result = paginate_list(get_predefined_categories())
+            logger.info("predefined categories retrieved by user %s", user)
+            return result, 200
+
         query = get_user_categories(user, query_params)
 
         # Use pagination utility
         result = paginate(
             query=query, schema=categories_schema, endpoint="category.categories"
         )
-        logger.info(f"category retrieved succesfully by user {user}")
+        logger.info("category retrieved succesfully by user %s", user)
         return result, 200
 
     def post(self):
@@ -52,7 +67,7 @@ class CategoryListResource(Resource):
             # Get data
             data = request.get_json() or {}
             logger.info(
-                f"Category creation request received by user {g.user.id}: {data}"
+                "Category creation request received by user %s: %s", g.user.id, data
             )
 
             # Validate and create category
@@ -61,8 +76,10 @@ class CategoryListResource(Resource):
             # Save to database
             db.session.add(category)
             db.session.commit()
+            if category.is_predefined:
+                invalidate_predefined_categories()
             logger.info(
-                f"Category created successfully: {category.id} by user {g.user.id}"
+                "Category created successfully: %s by user %s", category.id, g.user.id
             )
 
             return category_schema.dump(category), 201
@@ -86,7 +103,7 @@ class CategoryDetailResource(Resource):
         # Object is already loaded by permission decorator
         category = g.object
         logger.info(
-            f"Category {category.id} retrieved successfully by user {g.user.id}"
+            "Category %s retrieved successfully by user %s", category.id, g.user.id
         )
         return category_schema.dump(category), 200
 
@@ -97,7 +114,10 @@ class CategoryDetailResource(Resource):
             data = request.get_json() or {}
 
             logger.info(
-                f"Category update request for {category.id} by user {g.user.id}: {data}"
+                "Category update request for %s by user %s: %s",
+                category.id,
+                g.user.id,
+                data,
             )
 
             # Update just the name using the update schema
@@ -106,9 +126,13 @@ class CategoryDetailResource(Resource):
             )
             updated_category.name = normalize_category_name(updated_category.name)
             db.session.commit()
+            if updated_category.is_predefined:
+                invalidate_predefined_categories()
 
             logger.info(
-                f"Category updated successfully: {updated_category.id} by user {g.user.id}"
+                "Category updated successfully: %s by user %s",
+                updated_category.id,
+                g.user.id,
             )
             return category_schema.dump(updated_category), 200
 
@@ -120,16 +144,20 @@ class CategoryDetailResource(Resource):
         # Object is already loaded by permission decorator
         category = g.object
 
-        # Perform check if category is used in transactions
-        transactions_exist = (
+        # Perform check if category is used in transactions.
+        # EXISTS lets Postgres stop at the first matching index entry instead
+        # of hydrating a full Transaction row just to discard it.
+        transactions_exist = db.session.query(
             Transaction.query.filter(
-                Transaction.category_id == category.id, Transaction.is_deleted == False
-            ).first()
-            is not None
-        )
+                Transaction.category_id == category.id,
+                Transaction.is_deleted.is_(False),
+            ).exists()
+        ).scalar()
         if transactions_exist:
             logger.warning(
-                f"Attempt to delete category {category.id} with existing transactions by user {g.user.id}"
+                "Attempt to delete category %s with existing transactions by user %s",
+                category.id,
+                g.user.id,
             )
             return {
                 "error": "This category cannot be deleted as there are associated transactions."
@@ -138,8 +166,10 @@ class CategoryDetailResource(Resource):
         # Soft delete the category
         category.is_deleted = True
         db.session.commit()
+        if category.is_predefined:
+            invalidate_predefined_categories()
 
         logger.info(
-            f"Category soft deleted successfully: {category.id} by user {g.user.id}"
+            "Category soft deleted successfully: %s by user %s", category.id, g.user.id
         )
         return {"message": "Category deleted successfully"}, 200
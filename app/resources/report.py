@@ -21,10 +21,15 @@ class TransactionReportResource(Resource):
                 "start_date": request.args.get("start_date"),
                 "end_date": request.args.get("end_date"),
                 "user_id": request.args.get("user_id"),
+                "include_transactions": request.args.get(
+                    "include_transactions", "false"
+                ),
             }
 
             logger.info(
-                f"User {user.id} requested transaction report with params: {query_params}"
+                "User %s requested transaction report with params: %s",
+                user.id,
+                query_params,
             )
 
             report_data = generate_transaction_report(user, query_params)
@@ -32,5 +37,5 @@ class TransactionReportResource(Resource):
             return report_data, 200
 
         except ValidationError as err:
-            logger.warning(f"Validation error in report generation: {str(err)}")
+            logger.warning("Validation error in report generation: %s", str(err))
             return {"error": str(err)}, 400
@@ -7,7 +7,7 @@ from app.extensions import db
 from app.models.transaction import Transaction
 from app.schemas.transaction import (
     transaction_schema,
-    transactions_schema,
+    transaction_list_schema,
     transaction_update_schema,
 )
 from app.services.transaction import (
@@ -18,7 +18,7 @@ from app.utils.permissions import (
     object_permission,
 )
 from app.utils.responses import validation_error_response
-from app.utils.pagination import paginate
+from app.utils.pagination import keyset_paginate, paginate
 from app.utils.logger import logger
 
 
@@ -40,18 +40,32 @@ class TransactionListResource(Resource):
             "user_id": request.args.get("user_id"),
         }
         logger.info(
-            f"User {user.id} requested transactions list with filters: {query_params}"
+            "User %s requested transactions list with filters: %s",
+            user.id,
+            query_params,
         )
         # Get filtered query
         query = get_user_transactions(user, query_params)
 
-        # Use pagination utility
-        result = paginate(
-            query=query, schema=transactions_schema, endpoint="transaction.transactions"
-        )
+        # Keyset pagination when a cursor is supplied (stays O(page size)
+        # at any depth); classic page/per_page pagination otherwise
+        if "cursor" in request.args:
+            result = keyset_paginate(
+                query=query,
+                schema=transaction_list_schema,
+                timestamp_col=Transaction.date_time,
+                id_col=Transaction.id,
+                cursor=request.args.get("cursor") or None,
+            )
+        else:
+            result = paginate(
+                query=query,
+                schema=transaction_list_schema,
+                endpoint="transaction.transactions",
+            )
 
         logger.info(
-            f"Returned {result['pagination']['total_items']} transactions to user {user.id}"
+            "Returned %s transactions to user %s", len(result["items"]), user.id
         )
         return result, 200
 
@@ -64,7 +78,7 @@ class TransactionListResource(Resource):
 
             current_user = g.user
 
-            logger.info(f"User {current_user.id} creating transaction: {data}")
+            logger.info("User %s creating transaction: %s", current_user.id, data)
 
             # Validate and create transaction
             transaction = transaction_schema.load(data)
@@ -74,7 +88,9 @@ class TransactionListResource(Resource):
             db.session.commit()
 
             logger.info(
-                f"Transaction created successfully with ID {transaction.id} by user {current_user.id}"
+                "Transaction created successfully with ID %s by user %s",
+                transaction.id,
+                current_user.id,
             )
 
             return transaction_schema.dump(transaction), 201
@@ -96,7 +112,7 @@ class TransactionDetailResource(Resource):
         # Object is already loaded by permission decorator
         transaction = g.object
 
-        logger.info(f"User {g.user.id} retrieved transaction {transaction_id}")
+        logger.info("User %s retrieved transaction %s", g.user.id, transaction_id)
 
         return transaction_schema.dump(transaction), 200
 
@@ -108,7 +124,7 @@ class TransactionDetailResource(Resource):
             data = request.get_json() or {}
 
             logger.info(
-                f"User {g.user.id} updating transaction {transaction_id}: {data}"
+                "User %s updating transaction %s: %s", g.user.id, transaction_id, data
             )
 
             # Update using the update schema that prevents changing user_id and type
@@ -118,7 +134,9 @@ class TransactionDetailResource(Resource):
             db.session.commit()
 
             logger.info(
-                f"Transaction {transaction_id} updated successfully by user {g.user.id}"
+                "Transaction %s updated successfully by user %s",
+                transaction_id,
+                g.user.id,
             )
             return transaction_schema.dump(updated_transaction), 200
 
@@ -131,13 +149,13 @@ class TransactionDetailResource(Resource):
         # Object is already loaded by permission decorator
         transaction = g.object
 
-        logger.info(f"User {g.user.id} deleting transaction {transaction_id}")
+        logger.info("User %s deleting transaction %s", g.user.id, transaction_id)
 
         # Soft delete the transaction
         transaction.is_deleted = True
         db.session.commit()
 
         logger.info(
-            f"Transaction {transaction_id} deleted successfully by user {g.user.id}"
+            "Transaction %s deleted successfully by user %s", transaction_id, g.user.id
         )
         return {"message": "Transaction deleted successfully"}, 200
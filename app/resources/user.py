@@ -1,13 +1,15 @@
 from flask_restful import Resource
 from flask import request, g
-from flask import url_for
 from marshmallow import ValidationError
-from app.extensions import db
+from sqlalchemy import delete, update
+from sqlalchemy.orm import load_only
+from app.extensions import db, redis_client
+from app.utils.cache import invalidate_cached_user
 from app.models.user import User
 from app.models.auth import ActiveAccessToken
 from app.schemas.user import (
     user_profile_schema,
-    users_profile_schema,
+    users_list_serializer,
     user_update_schema,
     email_change_request_schema,
     email_change_confirm_schema,
@@ -31,9 +33,10 @@ from app.utils.permissions import (
 )
 from app.tasks.user import send_staff_email_change_verification
 from app.utils.responses import validation_error_response
-from app.utils.pagination import paginate
+from app.utils.pagination import keyset_paginate, paginate
 from app.utils.logger import logger
-from app.utils.tokens import TokenHandler
+from app.utils.tokens import TokenHandler, _user_tokens_key, tombstone_token_mirrors
+from app.utils.urls import external_url
 
 
 class UserListResource(Resource):
@@ -43,15 +46,43 @@ class UserListResource(Resource):
     @staff_required()
     def get(self):
         """Get paginated list of all users"""
-        logger.info(f"Staff user {g.user} requested list of all users")
-
-        query = User.query.filter_by(is_deleted=False).order_by(User.created_at.desc())
-
-        # Use pagination utility
-        logger.info(f"Returned list of all users to staff user {g.user}")
-        result = paginate(
-            query=query, schema=users_profile_schema, endpoint="user.users"
+        logger.info("Staff user %s requested list of all users", g.user)
+
+        # Fetch only the profile columns the list serializer dumps; the
+        # bcrypt password hash in particular never needs to leave the DB
+        query = (
+            User.query.options(
+                load_only(
+                    User.id,
+                    User.username,
+                    User.email,
+                    User.name,
+                    User.is_staff,
+                    User.is_verified,
+                    User.is_deleted,
+                    User.created_at,
+                    User.updated_at,
+                )
+            )
+            .filter_by(is_deleted=False)
+            .order_by(User.created_at.desc())
         )
+
+        # Keyset pagination when a cursor is supplied (stays O(page size)
+        # at any depth); classic page/per_page pagination otherwise
+        if "cursor" in request.args:
+            result = keyset_paginate(
+                query=query,
+                schema=users_list_serializer,
+                timestamp_col=User.created_at,
+                id_col=User.id,
+                cursor=request.args.get("cursor") or None,
+            )
+        else:
+            result = paginate(
+                query=query, schema=users_list_serializer, endpoint="user.users"
+            )
+        logger.info("Returned list of all users to staff user %s", g.user)
         return result, 200
 
 
@@ -66,23 +97,24 @@ class UserDetailResource(Resource):
     def get(self, user_id):
         """Get user details"""
         logger.info(
-            f"User {g.user} requested to get the profile details of user {g.object}"
+            "User %s requested to get the profile details of user %s", g.user, g.object
         )
 
         user = g.object
-        logger.info(f"Returned profile details for user {g.user}")
+        logger.info("Returned profile details for user %s", g.user)
         return user_profile_schema.dump(user), 200
 
     def patch(self, user_id):
         """Update user profile (username, name)"""
         try:
             # Get data and users
-            print("this ")
             data = request.get_json() or {}
 
-            print("helos")
             logger.info(
-                f"User {g.user} requested to update the profile details of user {g.object} with data {data}"
+                "User %s requested to update the profile details of user %s with data %s",
+                g.user,
+                g.object,
+                data,
             )
             user = g.object
             current_user = g.user
@@ -91,7 +123,7 @@ class UserDetailResource(Resource):
             updated_user = user_update_schema.load(data, instance=user, partial=True)
             db.session.commit()
 
-            logger.info(f"Profile details updated successfully for user {g.user}")
+            logger.info("Profile details updated successfully for user %s", g.user)
             return user_profile_schema.dump(updated_user), 200
 
         except ValidationError as e:
@@ -102,17 +134,13 @@ class UserDetailResource(Resource):
         try:
             # Get request data and users
             data = request.get_json() or {}
-            logger.info(f"User {g.user} requested to delete user {g.object}")
+            logger.info("User %s requested to delete user %s", g.user, g.object)
 
             current_user = g.user
             target_user = g.object
 
-            # Set context for schema validation
-            user_deletion_schema.context = {
-                "current_user": current_user,
-                "target_user": target_user,
-            }
-            # Validate request data
+            # Validate request data (the schema reads both users from g, so
+            # the shared instance carries no per-request state)
             validated_data = user_deletion_schema.load(data)
             # Delete the user account
             delete_user_account(current_user, target_user)
@@ -136,15 +164,13 @@ class PasswordUpdateResource(Resource):
         try:
             # Get request data
             data = request.get_json() or {}
-            logger.info(f"User {g.user} requested to update his account password")
+            logger.info("User %s requested to update his account password", g.user)
 
             # g.object is set by object_permission
             target_user = g.object
 
-            # Pass target_user to schema context for current_password validation
-            password_update_schema.context = {"target_user": target_user}
-
-            # Validate and load data using the schema
+            # Validate and load data using the schema (the target user is
+            # read from g inside the current_password validator)
             validated_data = password_update_schema.load(data)
 
             # Get current token
@@ -155,25 +181,38 @@ class PasswordUpdateResource(Resource):
 
             # Update password
             target_user.set_password(validated_data["new_password"])
-            db.session.commit()
 
-            # Invalidate all tokens except current one
+            # Invalidate all tokens except the current one with a single
+            # bulk DELETE, committed together with the password change so
+            # both land in one transaction. The per-user Redis set also
+            # covers tokens whose deferred insert has not landed yet;
+            # tombstoning every mirror (rather than deleting) keeps the
+            # revocation visible to a late store_active_token task
+            rows = []
+            issued = set()
             if current_token:
-                to_delete = (
-                    ActiveAccessToken.query.filter_by(user_id=target_user.id)
-                    .filter(ActiveAccessToken.access_token != current_token)
-                    .all()
-                )
-                for token in to_delete:
-                    db.session.delete(token)
-                db.session.commit()
+                issued = redis_client.smembers(_user_tokens_key(target_user.id))
+                rows = db.session.execute(
+                    delete(ActiveAccessToken)
+                    .where(
+                        ActiveAccessToken.user_id == target_user.id,
+                        ActiveAccessToken.access_token != current_token,
+                    )
+                    .returning(ActiveAccessToken.access_token)
+                ).all()
+            db.session.commit()
+            revoked = ({row.access_token for row in rows} | issued) - {current_token}
+            if revoked:
+                pipe = tombstone_token_mirrors(revoked)
+                pipe.srem(_user_tokens_key(target_user.id), *revoked)
+                pipe.execute()
 
-            logger.info(f"Password updated successfully for user: {target_user.email}")
+            logger.info("Password updated successfully for user: %s", target_user.email)
 
             return {"message": "Password updated successfully"}, 200
 
         except ValidationError as err:
-            logger.warning(f"Validation error: {err.messages}")
+            logger.warning("Validation error: %s", err.messages)
             return validation_error_response(err)
 
 
@@ -196,15 +235,18 @@ class UserEmailChangeResource(Resource):
             request_user = g.user
             target_user = g.object  # Already set by object_permission decorator
             logger.info(
-                f"User {request_user.id} requesting email change for user {target_user.id} to {data.get('new_email', 'unknown')}"
+                "User %s requesting email change for user %s to %s",
+                request_user.id,
+                target_user.id,
+                data.get("new_email", "unknown"),
             )
-            # Validate request data
-            email_change_request_schema.context = {"user": target_user}
+            # Validate request data (the schema reads the target user from g)
             validated_data = email_change_request_schema.load(data)
             new_email = validated_data["new_email"]
 
-            # CASE 1: User changing their own email (staff or regular)
-            if str(request_user.id) == str(user_id):
+            # CASE 1: User changing their own email (staff or regular).
+            # g.object carries the target's native UUID, so no str() casts
+            if request_user.id == target_user.id:
                 # Use the existing OTP flow for self email change
                 request_email_change(target_user, new_email)
                 return {
@@ -215,14 +257,16 @@ class UserEmailChangeResource(Resource):
             # (We know it's a staff user because other users would be blocked by the permission decorator)
             # Generate verification token and send email link
             token = generate_staff_email_change_token(target_user, new_email)
-            verification_url = url_for("user.verify-email", token=token, _external=True)
+            verification_url = external_url(f"/api/users/api/verify-email/{token}")
 
             # Send verification email to the new email address
             send_staff_email_change_verification.delay(
                 new_email, verification_url, target_user.username
             )
             logger.info(
-                f"Verification email sent to {new_email} for staff-initiated email change for user {target_user.id}"
+                "Verification email sent to %s for staff-initiated email change for user %s",
+                new_email,
+                target_user.id,
             )
             return {
                 "message": f"Verification link sent to {new_email}. User must click the link to confirm email change."
@@ -258,7 +302,7 @@ class EmailChangeConfirmResource(Resource):
                 validated_data["current_email_otp"],
                 validated_data["new_email_otp"],
             )
-            logger.info(f"Email updated successfully for user {target_user}")
+            logger.info("Email updated successfully for user %s", target_user)
             return {"message": "Email address updated successfully"}, 200
 
         except ValidationError as e:
@@ -280,18 +324,27 @@ class EmailChangeVerifyTokenResource(Resource):
             if not user_id or not new_email:
                 return {"error": "Invalid or expired verification token"}, 400
 
-            # Get the user
-            user = User.query.get(user_id)
-            if not user:
+            # One UPDATE ... RETURNING replaces the SELECT + flush round
+            # trips; RETURNING id doubles as the existence check
+            updated_id = db.session.execute(
+                update(User)
+                .where(User.id == user_id)
+                .values(email=new_email)
+                .returning(User.id)
+            ).scalar()
+            if updated_id is None:
+                db.session.rollback()
                 return {"error": "User not found"}, 404
-
-            # Update the user's email
-            user.email = new_email
             db.session.commit()
+            invalidate_cached_user(updated_id)
 
-            logger.info(f"Email updated successfully for user {user} to {new_email}")
+            logger.info(
+                "Email updated successfully for user %s to %s", updated_id, new_email
+            )
             return {"message": "Email address updated successfully"}, 200
 
         except Exception as e:
-            logger.error(f"Error verifying email change token: {str(e)}", exc_info=True)
+            logger.error(
+                "Error verifying email change token: %s", str(e), exc_info=True
+            )
             return {"error": "Failed to verify email change", "details": str(e)}, 500
@@ -6,44 +6,50 @@ from marshmallow import (
     EXCLUDE,
     validates_schema,
 )
-from app.extensions import ma
+from app.extensions import ma, db
 from app.models.user import User
-from app.utils.validators import validate_email, validate_password, validate_username
+from app.utils.validators import validate_password, validate_username
 
 
 class UserSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
         model = User
         load_instance = True
-        fields = [
+        fields = (
             "id",
             "username",
             "email",
             "password",
             "name",
-            "is_staff" "is_verified",
+            "is_staff",
+            "is_verified",
             "is_deleted",
             "created_at",
             "updated_at",
-        ]
+        )
 
-        load_only = ["password"]
-        dump_only = [
+        load_only = ("password",)
+        dump_only = (
             "id",
             "is_deleted",
             "created_at",
             "updated_at",
             "is_staff",
             "is_verified",
-        ]
+        )
         unknown = EXCLUDE
 
     username = fields.String(
         required=True, validate=[validate.Length(min=5, max=120), validate_username]
     )
-    email = fields.Email(required=True, validate=validate_email)
+    email = fields.Email(required=True, validate=validate.Length(max=120))
     password = fields.String(required=True, validate=validate_password, load_only=True)
 
+    # Uniqueness is not probed here: the INSERT has to reach the unique
+    # constraints anyway, and create_user maps an IntegrityError back to
+    # the same field-level errors. The common not-taken signup therefore
+    # costs zero extra DB round-trips.
+
 
 class ResendAccountVerificationLinkSchema(ma.Schema):
     email = fields.Email(required=True, validate=validate.Length(max=120))
@@ -59,10 +65,13 @@ class PasswordResetRequestSchema(ma.Schema):
 
     @validates("email")
     def validate_email(self, value):
-        user = User.query.filter_by(
-            email=value, is_deleted=False, is_verified=True
-        ).first()
-        if not user:
+        # Existence-only check: select just the id rather than the full row
+        exists = (
+            db.session.query(User.id)
+            .filter_by(email=value, is_deleted=False, is_verified=True)
+            .scalar()
+        )
+        if not exists:
             raise ValidationError("No user found with this email address.")
         return value
 
@@ -15,7 +15,6 @@ from app.utils.constants import (
     CATEGORY_NAME_MAX_LENGTH as max_len,
 )
 from flask import g
-from sqlalchemy import or_, func
 
 
 class CategorySchema(ma.SQLAlchemyAutoSchema):
@@ -43,21 +42,33 @@ class CategorySchema(ma.SQLAlchemyAutoSchema):
     @validates("user_id")
     def validate_user_id(self, value):
         """Validate user_id - this runs after format validation"""
-        # Check if the user exists
-        user = User.query.get(value)
-        if not user or user.is_deleted:
-            raise ValidationError("User not found")
-
-        # Get current user for permission check
         current_user = g.user
 
+        # The authenticated user is already loaded and known to be live, so
+        # the common self-create case needs no query; otherwise fetch just
+        # the is_staff flag instead of hydrating the whole user row
+        if value == current_user.id:
+            target_is_staff = current_user.is_staff
+        else:
+            row = (
+                db.session.query(User.is_staff)
+                .filter_by(id=value, is_deleted=False)
+                .first()
+            )
+            if row is None:
+                raise ValidationError("User not found")
+            target_is_staff = row[0]
+
+        # Stash it for the schema-level validator so it doesn't re-query
+        g.category_target_is_staff = target_is_staff
+
         # Normal users can only create categories for themselves
         if not current_user.is_staff:
-            if str(value) != str(current_user.id):
+            if value != current_user.id:
                 raise ValidationError("You can create categories for yourself only")
         else:
             # Staff users can create categories for themselves only
-            if user.is_staff and str(value) != str(current_user.id):
+            if target_is_staff and value != current_user.id:
                 raise ValidationError(
                     "You cannot create a category on behalf of other users"
                 )
@@ -86,20 +97,21 @@ class CategorySchema(ma.SQLAlchemyAutoSchema):
 
         # Use the validated user_id which we know is valid at this point
         user_id = data["user_id"]
-        user = User.query.get(user_id)
 
-        # Check if a category with this normalized name already exists for this user or as a predefined category
-        # Using func.lower for case-insensitive comparison
-        exists = (
-            db.session.query(Category)
+        # Check if a category with this normalized name already exists for this user or as a predefined category.
+        # Names are lowercased by normalize_category_name before they are
+        # stored, so a plain (indexable) equality compare is enough here.
+        # SELECT EXISTS(...) lets the planner short-circuit on first match
+        # and hydrates nothing
+        exists = db.session.query(
+            db.session.query(Category.id)
             .filter(
                 Category.is_deleted == False,
-                func.lower(Category.name) == func.lower(normalized_name),
+                Category.name == normalized_name,
             )
             .filter((Category.user_id == user_id) | (Category.is_predefined == True))
-            .first()
-            is not None
-        )
+            .exists()
+        ).scalar()
 
         if exists:
             raise ValidationError(
@@ -108,7 +120,7 @@ class CategorySchema(ma.SQLAlchemyAutoSchema):
 
         # Store normalized name back in data
         data["name"] = normalized_name
-        data["is_predefined"] = user.is_staff
+        data["is_predefined"] = g.get("category_target_is_staff", False)
 
 
 class CategoryUpdateSchema(ma.SQLAlchemyAutoSchema):
@@ -138,9 +150,10 @@ class CategoryUpdateSchema(ma.SQLAlchemyAutoSchema):
         if instance.name == normalized_name:
             return normalized_name
 
-        # Check if a category with this normalized name already exists for this user or as a predefined category
-        exists = (
-            db.session.query(Category)
+        # Check if a category with this normalized name already exists for
+        # this user or as a predefined category (EXISTS probe, no hydration)
+        exists = db.session.query(
+            db.session.query(Category.id)
             .filter(
                 Category.is_deleted == False,
                 Category.id != instance.id,
@@ -150,9 +163,8 @@ class CategoryUpdateSchema(ma.SQLAlchemyAutoSchema):
                 (Category.user_id == instance.user_id)
                 | (Category.is_predefined == True)
             )
-            .first()
-            is not None
-        )
+            .exists()
+        ).scalar()
         if exists:
             raise ValidationError("A category with this name already exists")
 
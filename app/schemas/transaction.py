@@ -49,42 +49,54 @@ class TransactionSchema(ma.SQLAlchemyAutoSchema):
     @validates("user_id")
     def validate_user_id(self, value):
         """Validate user_id field"""
-        logger.debug(f"Validating user_id: {value}")
-        # Check if the user exists
-        user = User.query.get(value)
-
-        if not user or user.is_deleted:
-            logger.warning(f"Validation failed: User not found for ID {value}")
-            raise ValidationError("User not found")
-
-        # Get current user for permission check
+        logger.debug("Validating user_id: %s", value)
         current_user = g.user
 
+        # The authenticated user is already loaded and known to be live, so
+        # the common self-create case needs no query; otherwise select just
+        # the is_staff flag instead of hydrating the whole user row
+        if value == current_user.id:
+            target_is_staff = current_user.is_staff
+        else:
+            row = (
+                db.session.query(User.is_staff)
+                .filter_by(id=value, is_deleted=False)
+                .first()
+            )
+            if row is None:
+                logger.warning("Validation failed: User not found for ID %s", value)
+                raise ValidationError("User not found")
+            target_is_staff = row[0]
+
         # Normal users can only create transactions for themselves
         if not current_user.is_staff:
-            if str(value) != str(current_user.id):
+            if value != current_user.id:
                 raise ValidationError("You can create transactions for yourself only")
         else:
             # Staff users can create transactions for normal users only
-            if user.is_staff:
+            if target_is_staff:
                 raise ValidationError(
                     "Staff cannot create transactions for staff users"
                 )
 
-        logger.debug(f"User_id validation passed for ID {value}")
+        logger.debug("User_id validation passed for ID %s", value)
         return value
 
     @validates("category_id")
     def validate_category_id(self, value):
         """Validate category_id field"""
-        logger.debug(f"Validating category_id: {value}")
+        logger.debug("Validating category_id: %s", value)
 
         # Check if category exists and is not deleted
         category = Category.query.get(value)
         if not category or category.is_deleted:
             raise ValidationError("Category not found")
 
-        logger.debug(f"Category_id validation passed for ID {value}")
+        # Stash on g so the schema-level validator reuses this row instead
+        # of issuing a second identical SELECT
+        g.transaction_category = category
+
+        logger.debug("Category_id validation passed for ID %s", value)
         return value
 
     @validates_schema
@@ -96,10 +108,14 @@ class TransactionSchema(ma.SQLAlchemyAutoSchema):
         category_id = data["category_id"]
 
         # Verify the category is available to this user
-        # (either it's the user's own category or a predefined one)
-        category = Category.query.get(category_id)
-
-        if not category.is_predefined and str(category.user_id) != str(user_id):
+        # (either it's the user's own category or a predefined one).
+        # The field validator already fetched it and left it on g.
+        category = g.get("transaction_category")
+        if category is None or category.id != category_id:
+            category = Category.query.get(category_id)
+
+        # Both sides are uuid.UUID instances, so compare them directly
+        if not category.is_predefined and category.user_id != user_id:
             raise ValidationError(
                 {"category_id": ["Category does not belong to the provided user."]}
             )
@@ -123,7 +139,7 @@ class TransactionUpdateSchema(ma.SQLAlchemyAutoSchema):
     @validates("category_id")
     def validate_category_id(self, value):
         """Validate category_id field"""
-        logger.debug(f"Validating category_id for update: {value}")
+        logger.debug("Validating category_id for update: %s", value)
 
         # Check if category exists and is not deleted
         category = Category.query.get(value)
@@ -135,16 +151,16 @@ class TransactionUpdateSchema(ma.SQLAlchemyAutoSchema):
 
         # Verify the category is available to this user
         # (either it's the user's own category or a predefined one)
-        if not category.is_predefined and str(category.user_id) != str(
-            instance.user_id
-        ):
+        if not category.is_predefined and category.user_id != instance.user_id:
             raise ValidationError("Category does not belong to the provided user.")
 
-        logger.debug(f"Update category_id validation passed for ID {value}")
+        logger.debug("Update category_id validation passed for ID %s", value)
         return value
 
 
 # Initialize schemas
 transaction_schema = TransactionSchema()
 transactions_schema = TransactionSchema(many=True)
+# List pages skip the free-text description so the rows stay small
+transaction_list_schema = TransactionSchema(many=True, exclude=("description",))
 transaction_update_schema = TransactionUpdateSchema()
@@ -1,9 +1,20 @@
 import re
-from marshmallow import fields, validates, ValidationError, EXCLUDE, validates_schema
-from app.extensions import ma
+from flask import g
+from marshmallow import (
+    fields,
+    validate,
+    validates,
+    ValidationError,
+    EXCLUDE,
+    validates_schema,
+)
+from app.extensions import ma, db
 from app.models.user import User
 from app.utils.validators import validate_username, validate_password
 
+# Compiled once at import so the hot validation path skips the re-cache lookup
+_USERNAME_RE = re.compile(r"\A[A-Za-z0-9_]+\Z")
+
 
 class UserProfileSchema(ma.SQLAlchemyAutoSchema):
     """Schema for user profile data"""
@@ -31,6 +42,37 @@ class UserProfileSchema(ma.SQLAlchemyAutoSchema):
         )
 
 
+class UserProfileListSerializer:
+    """Hand-rolled serializer for the paginated users list.
+
+    Duck-types the schema interface paginate() expects but dumps with a
+    plain comprehension: marshmallow's per-field machinery is the dominant
+    CPU cost when serializing large pages, and the profile fields are all
+    simple columns.
+    """
+
+    @staticmethod
+    def dump(users):
+        return [
+            {
+                "id": str(user.id),
+                "username": user.username,
+                "email": user.email,
+                "name": user.name,
+                "is_staff": user.is_staff,
+                "is_verified": user.is_verified,
+                "is_deleted": user.is_deleted,
+                "created_at": (
+                    user.created_at.isoformat() if user.created_at else None
+                ),
+                "updated_at": (
+                    user.updated_at.isoformat() if user.updated_at else None
+                ),
+            }
+            for user in users
+        ]
+
+
 class UserUpdateSchema(ma.SQLAlchemyAutoSchema):
     """Base schema for user updates with validation"""
 
@@ -44,11 +86,12 @@ class UserUpdateSchema(ma.SQLAlchemyAutoSchema):
     @validates("username")
     def validate_username(self, value):
         """Validate username is unique"""
-        if not re.match(r"^[a-zA-Z0-9_]+$", value):
+        if not _USERNAME_RE.match(value):
             raise ValidationError(
                 "Username must contain only letters, numbers, underscores, dots, or hyphens."
             )
-        if len(value) < 5 or len(value) > 120:
+        n = len(value)
+        if n < 5 or n > 120:
             raise ValidationError("Username length should be between 5 to 120")
         # Get current instance
         instance = getattr(self, "instance", None)
@@ -57,9 +100,16 @@ class UserUpdateSchema(ma.SQLAlchemyAutoSchema):
         if instance and instance.username == value:
             return value
 
-        # Check uniqueness
-        user = User.query.filter_by(username=value).first()
-        if user:
+        # Check uniqueness with an id-only existence probe. Soft-deleted
+        # users still hold their username at the DB level, so opt out of
+        # the global filter or the commit hits the unique constraint
+        exists = (
+            db.session.query(User.id)
+            .filter_by(username=value)
+            .execution_options(include_deleted=True)
+            .scalar()
+        )
+        if exists:
             raise ValidationError("Username already exists")
         return value
 
@@ -72,8 +122,10 @@ class PasswordUpdateSchema(ma.Schema):
     @validates("current_password")
     def validate_current_password(self, value):
         """Validate that the current_password matches the target user's password"""
-        # Access target_user from schema context
-        target_user = self.context.get("target_user")
+        # The target user is placed on g by the object_permission decorator;
+        # reading it there keeps the shared schema instance free of
+        # per-request state (schema.context is not thread-safe)
+        target_user = g.get("object")
         if not target_user:
             raise ValidationError("User context not provided for validation")
 
@@ -91,20 +143,30 @@ class PasswordUpdateSchema(ma.Schema):
 class EmailChangeRequestSchema(ma.Schema):
     """Schema for requesting email change - simplified version without password"""
 
-    new_email = fields.Email(required=True)
+    new_email = fields.Email(required=True, validate=validate.Length(max=120))
 
     @validates("new_email")
     def validate_new_email(self, value):
-        # Check if email already exists
-        existing = User.query.filter_by(email=value).first()
-        if existing:
-            raise ValidationError("Email already exists")
-
-        # Check if it's different from current email
-        user = self.context.get("user")
+        # Compare against the already-loaded target user first (free), so
+        # the DB probe only runs for genuinely new addresses
+        # (target user comes from g, set by the object_permission decorator)
+        user = g.get("object")
         if user and user.email == value:
             raise ValidationError("New email must be different from your current email")
 
+        # Check if email is taken by anyone else (id-only existence probe;
+        # users.email is unique, so this is an index lookup). Soft-deleted
+        # users still hold their email at the DB level, so the probe must
+        # see them
+        existing = (
+            db.session.query(User.id)
+            .filter_by(email=value)
+            .execution_options(include_deleted=True)
+            .scalar()
+        )
+        if existing:
+            raise ValidationError("Email already exists")
+
         return value
 
 
@@ -127,9 +189,9 @@ class UserDeletionSchema(ma.Schema):
         Staff deleting other users don't need to provide a password.
         Users deleting their own account must provide their password.
         """
-        # Get context data
-        current_user = self.context.get("current_user")
-        target_user = self.context.get("target_user")
+        # Both users are placed on g by the permission decorators
+        current_user = g.get("user")
+        target_user = g.get("object")
 
         if not current_user or not target_user:
             raise ValidationError("Missing context data")
@@ -143,8 +205,11 @@ class UserDeletionSchema(ma.Schema):
                     "Password is required to delete your account", "password"
                 )
 
-            # Verify the password
-            if not current_user.check_password(password):
+            # Verify the password against the DB-loaded target row: g.user
+            # may come from the Redis cache, which deliberately omits the
+            # password hash. Non-staff can only delete themselves, so the
+            # target is the current user.
+            if not target_user.check_password(password):
                 raise ValidationError("Incorrect password", "password")
 
         return data
@@ -155,6 +220,7 @@ user_deletion_schema = UserDeletionSchema()
 # Initialize schemas
 user_profile_schema = UserProfileSchema()
 users_profile_schema = UserProfileSchema(many=True)
+users_list_serializer = UserProfileListSerializer()
 user_update_schema = UserUpdateSchema()
 password_update_schema = PasswordUpdateSchema()
 email_change_request_schema = EmailChangeRequestSchema()
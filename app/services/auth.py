@@ -1,14 +1,20 @@
 # app/services/auth.py
 import uuid, os
-import re
-from flask import url_for
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
 from flask_mail import Message
 from marshmallow.exceptions import ValidationError
 from app.extensions import db, bcrypt, redis_client, mail
 from app.models.user import User
 from app.utils.logger import logger
+from app.utils.cache import invalidate_cached_user
 from app.utils.tokens import TokenHandler
-from app.tasks.auth import send_verification_email, send_password_reset_email
+from app.utils.urls import external_url
+from app.tasks.auth import (
+    send_verification_email,
+    send_password_reset_email,
+    finish_password_reset,
+)
 from app.utils.constants import (
     ACCCOUNT_VERIFICATION_LINK_SEND_RATE_LIMIT,
     ACCCOUNT_VERIFICATION_LINK_VALIDITY,
@@ -16,29 +22,50 @@ from app.utils.constants import (
 
 
 def create_user(user):
-    """Create a new user and save to database."""
+    """Create a new user and save to database.
 
+    The unique constraints are authoritative: duplicates surface here as
+    an IntegrityError and are mapped to field-level messages, so signup
+    validation costs no probe SELECT at all.
+    """
     user.set_password(user.password)
     db.session.add(user)
-    db.session.commit()
-    logger.info(f"User created successfully: {user}")
+    try:
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        constraint = getattr(getattr(e.orig, "diag", None), "constraint_name", "") or ""
+        if constraint == "username_format":
+            raise ValidationError(
+                {
+                    "username": [
+                        "Username must contain only letters, numbers, underscores, dots, or hyphens."
+                    ]
+                }
+            )
+        if "username" in constraint:
+            raise ValidationError({"username": ["Username is already taken."]})
+        if "email" in constraint:
+            raise ValidationError({"email": ["Email is already in use."]})
+        raise
+    logger.info("User created successfully: %s", user)
     return user
 
 
-def send_account_verification_link(user, endpoint="auth.verify-user"):
+def send_account_verification_link(user):
     """
     Generate UUID token, store in Redis, and send email.
     Rate limited to prevent spam - only one link every 10 minutes per user.
     """
-    # Check if a rate limit key exists for this user
+    # Check if a rate limit key exists for this user. A single TTL call
+    # covers both the existence check and the remaining time (-2 = missing)
     rate_limit_key = f"verify_rate_limit:{user.id}"
 
-    # Check if user has requested a link in the past 10 minutes
-    if redis_client.exists(rate_limit_key):
-        time_remaining = redis_client.ttl(rate_limit_key)
-        minutes_remaining = int(time_remaining / 60) + 1  # Round up to next minute
+    time_remaining = redis_client.ttl(rate_limit_key)
+    if time_remaining > 0:
+        minutes_remaining = time_remaining // 60 + 1  # Round up to next minute
 
-        logger.warning(f"Rate limit hit for verification email to {user.email}")
+        logger.warning("Rate limit hit for verification email to %s", user.email)
         raise ValidationError(
             f"Please wait {minutes_remaining} minutes before requesting another verification link"
         )
@@ -50,19 +77,18 @@ def send_account_verification_link(user, endpoint="auth.verify-user"):
     verification_ttl = ACCCOUNT_VERIFICATION_LINK_VALIDITY
     rate_limit_ttl = ACCCOUNT_VERIFICATION_LINK_SEND_RATE_LIMIT
 
-    redis_client.setex(
-        redis_key, verification_ttl, str(user.id)
-    )  # Token expires in 10 minutes
-
-    # Set rate limit for 10 minutes (600 seconds)
-    redis_client.setex(rate_limit_key, rate_limit_ttl, "1")
+    # Token and rate-limit keys land in one network round-trip
+    with redis_client.pipeline(transaction=False) as pipe:
+        pipe.setex(redis_key, verification_ttl, str(user.id))  # 10 minutes
+        pipe.setex(rate_limit_key, rate_limit_ttl, "1")  # 10 minutes
+        pipe.execute()
 
-    logger.info(f"Stored token in Redis: {redis_key} -> {user.id}")
+    logger.info("Stored token in Redis: %s -> %s", redis_key, user.id)
 
-    verify_url = url_for(endpoint, token=token, _external=True)
+    verify_url = external_url(f"/api/auth/verify-user/{token}")
 
     send_verification_email.delay(user.email, verify_url)
-    logger.info(f"Account verification email sent to: {user.email}")
+    logger.info("Account verification email sent to: %s", user.email)
     return token
 
 
@@ -72,22 +98,33 @@ def verify_user_by_token(token):
     redis_key = f"verification_token:{token}"
     user_id = redis_client.get(redis_key)
     if not user_id:
-        logger.warning(f"Invalid or expired token: {token}")
+        logger.warning("Invalid or expired token: %s", token)
         raise ValidationError("Invalid or expired verification token")
 
-    user = User.query.get(uuid.UUID(user_id))
-    if not user:
-        logger.warning(f"No user found for token: {token}")
-        raise ValidationError("User not found")
-    if user.is_verified:
-        logger.info(f"User already verified: {user.email}")
+    # Flip the flag in a single UPDATE ... RETURNING instead of hydrating
+    # the full row just to set one boolean (SELECT + UPDATE)
+    row = db.session.execute(
+        update(User)
+        .where(User.id == user_id, User.is_verified == False)
+        .values(is_verified=True)
+        .returning(User.email)
+    ).first()
+
+    if row is None:
+        db.session.rollback()
+        # No row updated: either the user is already verified or does not
+        # exist; a cheap id-only probe tells the two apart
+        if db.session.query(User.id).filter_by(id=user_id).scalar() is None:
+            logger.warning("No user found for token: %s", token)
+            raise ValidationError("User not found")
+        logger.info("User already verified: %s", user_id)
         redis_client.delete(redis_key)  # Clean up
         return False
 
-    user.is_verified = True
     db.session.commit()
     redis_client.delete(redis_key)  # Clean up after verification
-    logger.info(f"User verified: {user.email}")
+    invalidate_cached_user(user_id)  # Cached copy still has is_verified=False
+    logger.info("User verified: %s", row.email)
     return True
 
 
@@ -95,52 +132,63 @@ def resend_account_verification_link(email):
     """Resend verification link for an existing, unverified user."""
     user = User.query.filter_by(email=email).first()
     if not user:
-        logger.warning(f"No user found with email: {email}")
+        logger.warning("No user found with email: %s", email)
         raise ValidationError("Email not registered")
     if user.is_verified:
-        logger.info(f"User already verified: {email}")
+        logger.info("User already verified: %s", email)
         raise ValidationError("User is already verified")
 
     # Generate and send new verification link
     token = send_account_verification_link(user)
-    logger.info(f"Resent verification email to: {email}")
+    logger.info("Resent verification email to: %s", email)
     return token
 
 
-def is_email(login_str):
-    """Check if string is an email format."""
-    # Simple regex for basic email validation
-    email_regex = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return re.match(email_regex, login_str) is not None
+# Pre-generated hash used to burn the same bcrypt cost on failed lookups,
+# so response timing does not reveal whether an identifier exists. Built
+# lazily because hashing needs the app-configured bcrypt rounds.
+_DUMMY_HASH = None
+
+
+def _burn_password_check(password):
+    """Run a bcrypt check against a dummy hash, ignoring the result."""
+    global _DUMMY_HASH
+    if _DUMMY_HASH is None:
+        _DUMMY_HASH = bcrypt.generate_password_hash("dummy").decode("utf-8")
+    bcrypt.check_password_hash(_DUMMY_HASH, password)
 
 
 def authenticate_user(login_identifier, password):
     """
     Authenticate a user by username or email and password.
     """
-    # Determine if the login identifier is an email or username
-    if is_email(login_identifier):
-        user = User.query.filter_by(email=login_identifier, is_deleted=False).first()
-        identifier_type = "email"
-    else:
-        user = User.query.filter_by(username=login_identifier, is_deleted=False).first()
-        identifier_type = "username"
+    # One indexed lookup covers both identifier kinds - email and username
+    # are both unique columns, so the planner resolves the OR with the two
+    # existing indexes and no format sniffing is needed up front
+    user = User.query.filter(
+        or_(User.email == login_identifier, User.username == login_identifier)
+    ).first()
 
     if not user:
+        # Equalize timing with the found-user path before rejecting
+        _burn_password_check(password)
         logger.warning(
-            f"Login attempt with non-existent {identifier_type}: {login_identifier}"
+            "Login attempt with non-existent identifier: %s", login_identifier
         )
         raise ValidationError("Invalid username/email or password")
 
     if not user.is_verified:
-        logger.warning(f"Login attempt with unverified account: {login_identifier}")
+        # Burn the same bcrypt cost here too so this branch is not
+        # distinguishable from a wrong password by timing
+        user.check_password(password)
+        logger.warning("Login attempt with unverified account: %s", login_identifier)
         raise ValidationError("Please verify your email before logging in")
 
     if not user.check_password(password):
-        logger.warning(f"Failed login attempt for user: {login_identifier}")
+        logger.warning("Failed login attempt for user: %s", login_identifier)
         raise ValidationError("Invalid username/email or password")
 
-    logger.info(f"User authenticated successfully: {login_identifier}")
+    logger.info("User authenticated successfully: %s", login_identifier)
     return user
 
 
@@ -150,26 +198,27 @@ def generate_tokens(user):
     access_token = TokenHandler.generate_access_token(user, True)
     refresh_token = TokenHandler.generate_refresh_token(user)
 
-    logger.info(f"Generated tokens for user: {user.username}")
+    logger.info("Generated tokens for user: %s", user.username)
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
     }
 
 
-def send_password_reset_link(email, endpoint="auth.reset-password-confirm"):
+def send_password_reset_link(email):
     """
     Send a password reset link to user's email.
     """
-    user = User.query.filter_by(email=email, is_deleted=False).first()
+    user = User.query.filter_by(email=email).first()
 
-    # Check if a reset email was recently sent (rate limit)
+    # Check if a reset email was recently sent (rate limit); one TTL call
+    # replaces the EXISTS + TTL pair (-2 = key missing)
     rate_limit_key = f"password_reset_link_rate_limit:{user.id}"
-    if redis_client.exists(rate_limit_key):
-        time_remaining = redis_client.ttl(rate_limit_key)
-        minutes_remaining = int(time_remaining / 60)
+    time_remaining = redis_client.ttl(rate_limit_key)
+    if time_remaining > 0:
+        minutes_remaining = time_remaining // 60
 
-        logger.warning(f"Rate limit hit for password reset email to {email}")
+        logger.warning("Rate limit hit for password reset email to %s", email)
         raise ValidationError(
             f"Please wait {minutes_remaining} minutes before requesting another reset link"
         )
@@ -179,40 +228,28 @@ def send_password_reset_link(email, endpoint="auth.reset-password-confirm"):
     TokenHandler.store_reset_token(user.id, token)
 
     # Generate reset URL
-    reset_url = url_for(endpoint, token=token, _external=True)
+    reset_url = external_url(f"/api/auth/reset-password-confirm/{token}")
 
     send_password_reset_email.delay(email, reset_url)
 
-    logger.info(f"Password reset email sent to: {email} with token: {token}")
+    logger.info("Password reset email sent to: %s with token: %s", email, token)
     return True
 
 
 def reset_password_with_token(token, new_password):
     """
-    Reset a user's password using a valid reset token.
+    Queue a password reset for a valid reset token.
+
+    The bcrypt hash and the write happen in a Celery worker so the HTTP
+    request is not blocked for the duration of the hash.
+    verify_reset_token deletes the token on first use, so a double submit
+    cannot queue the reset twice.
     """
     user_id = TokenHandler.verify_reset_token(token)
     if not user_id:
-        logger.warning(f"Invalid or expired password reset token")
+        logger.warning("Invalid or expired password reset token")
         raise ValidationError("Invalid or expired reset token")
 
-    try:
-        user = User.query.get(uuid.UUID(user_id))
-        if not user or user.is_deleted:
-            logger.warning(f"User not found for reset token: {token}")
-            raise ValidationError("User not found")
-
-        # Update password
-        user.set_password(new_password)
-        db.session.commit()
-
-        # Invalidate all existing tokens
-        TokenHandler.invalidate_user_access_tokens(user.id)
-
-        logger.info(f"Password reset successful for user: {user.email}")
-        return user
-
-    except Exception as e:
-        db.session.rollback()
-        logger.error(f"Error resetting password: {str(e)}", exc_info=True)
-        raise ValidationError("An error occurred while resetting your password")
+    finish_password_reset.delay(user_id, new_password)
+    logger.info("Password reset queued for user: %s", user_id)
+    return True
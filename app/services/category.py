@@ -1,9 +1,14 @@
+import json
+
+from app.extensions import db, redis_client
 from app.models.category import Category
-from app.models.user import User
+from app.schemas.category import categories_schema
+from app.utils.constants import PREDEFINED_CATEGORY_CACHE_TTL
 from app.utils.logger import logger
-from app.utils.validators import is_valid_uuid
+from app.utils.validators import category_key, is_valid_uuid, normalize_category_name
 from marshmallow import ValidationError
 from sqlalchemy import or_, func
+
 from flask import g
 
 
@@ -18,7 +23,9 @@ def get_user_categories(user, query_params=None):
     Returns:
         SQLAlchemy query object with appropriate filters
     """
-    logger.info(f"Getting categories for user {user.id} with filters: {query_params}")
+    logger.info(
+        "Getting categories for user %s with filters: %s", user.id, query_params
+    )
 
     # Initialize query
     query_params = query_params or {}
@@ -26,31 +33,110 @@ def get_user_categories(user, query_params=None):
     # Start with base query depending on user type
     if user.is_staff:
         # Staff can see all categories
-        logger.debug(f"User {user.id} is staff, retrieving all categories")
-        query = Category.query
+        logger.debug("User %s is staff, retrieving all categories", user.id)
+        query = Category.query.execution_options(include_deleted=True)
 
         # If specific user_id is provided and user is staff, filter by that
         if "user_id" in query_params and query_params["user_id"]:
             user_id = query_params["user_id"]
 
             if is_valid_uuid(user_id):
-                logger.debug(f"Filtering categories by user_id: {user_id}")
+                logger.debug("Filtering categories by user_id: %s", user_id)
                 query = query.filter(Category.user_id == user_id)
             else:
-                logger.warning(f"Invalid user_id format in request: {user_id}")
+                logger.warning("Invalid user_id format in request: %s", user_id)
                 raise ValidationError(f"Invalid user_id format: {user_id}")
     else:
         # Normal users can see predefined and their own categories
         logger.debug(
-            f"User {user.id} is not staff, retrieving predefined and own categories"
+            "User %s is not staff, retrieving predefined and own categories", user.id
         )
         query = Category.query.filter(
-            Category.is_deleted == False,
-            or_(Category.is_predefined == True, Category.user_id == user.id),
+            or_(Category.is_predefined == True, Category.user_id == user.id)
         )
 
+    # Optional predefined/custom filter
+    if "is_predefined" in query_params and query_params["is_predefined"]:
+        is_predefined = query_params["is_predefined"].lower() in ("true", "1")
+        query = query.filter(Category.is_predefined == is_predefined)
+
     # Order by creation date for consistency
     query = query.order_by(Category.created_at)
 
     logger.debug("Category query built successfully")
     return query
+
+
+PREDEFINED_CATEGORIES_CACHE_KEY = "categories:predefined"
+
+
+def get_predefined_categories():
+    """
+    Get the serialized global predefined categories, cached in Redis.
+
+    A single Redis GET replaces the Postgres query plus schema dump for
+    this stable result set; on a miss the list is rebuilt and cached.
+    """
+    cached = redis_client.get(PREDEFINED_CATEGORIES_CACHE_KEY)
+    if cached:
+        logger.debug("Predefined categories served from cache")
+        return json.loads(cached)
+
+    categories = (
+        Category.query.filter_by(is_predefined=True, is_deleted=False)
+        .order_by(Category.created_at)
+        .all()
+    )
+    data = categories_schema.dump(categories)
+    redis_client.setex(
+        PREDEFINED_CATEGORIES_CACHE_KEY,
+        PREDEFINED_CATEGORY_CACHE_TTL,
+        json.dumps(data),
+    )
+    return data
+
+
+def invalidate_predefined_categories():
+    """Drop the cached predefined listing after a predefined category changes."""
+    redis_client.delete(PREDEFINED_CATEGORIES_CACHE_KEY)
+
+
+def seed_predefined_categories(staff_user, names):
+    """
+    Bulk-create predefined categories owned by a staff user.
+
+    Sends one Core INSERT for the whole batch, so seeding N categories costs
+    a single round-trip instead of N ORM inserts. Names that already exist
+    as predefined categories are skipped.
+
+    Args:
+        staff_user: The staff user the categories are created on behalf of
+        names: Iterable of category names to seed
+
+    Returns:
+        Number of categories inserted
+    """
+    normalized = [normalize_category_name(name) for name in names]
+
+    # Both sides are canonical names here, so the cheap comparison key is
+    # enough and LOWER() moves out of the SQL
+    existing = {
+        category_key(name)
+        for (name,) in db.session.query(Category.name).filter(
+            Category.is_predefined == True, Category.is_deleted == False
+        )
+    }
+
+    rows = [
+        {"name": name, "user_id": staff_user.id, "is_predefined": True}
+        for name in normalized
+        if name and category_key(name) not in existing
+    ]
+
+    if rows:
+        db.session.execute(Category.__table__.insert(), rows)
+        db.session.commit()
+        invalidate_predefined_categories()
+
+    logger.info("Seeded %s predefined categories", len(rows))
+    return len(rows)
@@ -5,6 +5,7 @@ from app.models.user import User
 from app.utils.logger import logger
 from marshmallow import ValidationError
 from sqlalchemy import or_, and_
+from sqlalchemy.orm import load_only, selectinload
 from datetime import datetime, timedelta, timezone
 from flask import g
 from app.utils.validators import is_valid_uuid
@@ -21,15 +22,17 @@ def get_user_transactions(user, query_params=None):
     Returns:
         SQLAlchemy query object with appropriate filters
     """
-    logger.info(f"Getting transactions for user {user.id} with filters: {query_params}")
+    logger.info(
+        "Getting transactions for user %s with filters: %s", user.id, query_params
+    )
 
     # Initialize query
     query_params = query_params or {}
 
     if user.is_staff:
         # Staff can see all transactions
-        logger.debug(f"User {user.id} is staff, retrieving all transactions")
-        query = Transaction.query
+        logger.debug("User %s is staff, retrieving all transactions", user.id)
+        query = Transaction.query.execution_options(include_deleted=True)
 
         # If specific user_id is provided, filter by that
         if "user_id" in query_params and query_params["user_id"]:
@@ -37,30 +40,30 @@ def get_user_transactions(user, query_params=None):
             user_id = query_params["user_id"]
 
             if is_valid_uuid(user_id):
-                logger.debug(f"Filtering by user_id: {query_params["user_id"]}")
+                logger.debug("Filtering by user_id: %s", user_id)
                 query = query.filter(Transaction.user_id == user_id)
             else:
                 raise ValidationError(f"Invalid user_id format: {user_id}")
     else:
         # Normal users can only see their own transactions
-        logger.debug(f"User {user.id} is not staff, retrieving only their transactions")
-        query = Transaction.query.filter(
-            Transaction.is_deleted == False, Transaction.user_id == user.id
+        logger.debug(
+            "User %s is not staff, retrieving only their transactions", user.id
         )
+        query = Transaction.query.filter(Transaction.user_id == user.id)
 
     # Apply filters if provided
     if "type" in query_params and query_params["type"]:
         transaction_type = TransactionType(query_params["type"])
         if not transaction_type:
             raise ValidationError(f"Invalid transaction type: {query_params['type']}")
-        logger.debug(f"Filtering by transaction type: {transaction_type.value}")
+        logger.debug("Filtering by transaction type: %s", transaction_type.value)
         query = query.filter(Transaction.type == transaction_type)
 
     if "category_id" in query_params and query_params["category_id"]:
         category_id = query_params["category_id"]
 
         if is_valid_uuid(category_id):
-            logger.debug(f"Filtering by category_id: {query_params['category_id']}")
+            logger.debug("Filtering by category_id: %s", query_params["category_id"])
             query = query.filter(Transaction.category_id == category_id)
         else:
             raise ValidationError(f"Invalid category_id format {category_id}")
@@ -71,11 +74,11 @@ def get_user_transactions(user, query_params=None):
             from_date = datetime.fromisoformat(
                 query_params["from_date"].replace("Z", "+00:00")
             ).replace(tzinfo=timezone.utc)
-            logger.debug(f"Filtering by from_date: {from_date}")
+            logger.debug("Filtering by from_date: %s", from_date)
             query = query.filter(Transaction.date_time >= from_date)
         except (ValueError, TypeError) as e:
             logger.warning(
-                f"Invalid from_date format: {query_params['from_date']}, error: {e}"
+                "Invalid from_date format: %s, error: %s", query_params["from_date"], e
             )
             raise ValidationError(
                 f"Invalid from_date format: {query_params['from_date']}"
@@ -88,14 +91,33 @@ def get_user_transactions(user, query_params=None):
             ).replace(tzinfo=timezone.utc)
             # Set to end of the day (23:59:59 UTC)
             to_date = to_date.replace(hour=23, minute=59, second=59, microsecond=999999)
-            logger.debug(f"Filtering by to_date: {to_date}")
+            logger.debug("Filtering by to_date: %s", to_date)
             query = query.filter(Transaction.date_time <= to_date)
         except (ValueError, TypeError) as e:
             logger.warning(
-                f"Invalid to_date format: {query_params['to_date']}, error: {e}"
+                "Invalid to_date format: %s, error: %s", query_params["to_date"], e
             )
             raise ValidationError(f"Invalid to_date format: {query_params['to_date']}")
 
+    # Fetch only the columns the list schema dumps - the potentially large
+    # description text stays on the detail endpoint - and eager-load the
+    # category relationship in one batched SELECT so serialization never
+    # falls back to per-row lazy loads
+    query = query.options(
+        load_only(
+            Transaction.id,
+            Transaction.user_id,
+            Transaction.type,
+            Transaction.category_id,
+            Transaction.amount,
+            Transaction.date_time,
+            Transaction.is_deleted,
+            Transaction.created_at,
+            Transaction.updated_at,
+        ),
+        selectinload(Transaction.category).load_only(Category.id, Category.name),
+    )
+
     # Order by date_time descending (newest first)
     query = query.order_by(Transaction.date_time.desc())
 
@@ -1,6 +1,6 @@
+import hmac
 import uuid
 import secrets
-import string
 from marshmallow import ValidationError
 from app.extensions import db, redis_client
 from app.models.user import User
@@ -12,6 +12,7 @@ from app.utils.constants import (
     EMAIL_CHANGE_TOKEN_RESEND,
 )
 from app.tasks.user import soft_delete_user_related_objects
+from app.utils.cache import invalidate_cached_user
 from app.utils.tokens import TokenHandler
 
 
@@ -23,22 +24,33 @@ def request_email_change(user, new_email):
         # Use the same redis_key for both OTPs and rate limiting
         redis_key = f"email_change:{user.id}"
 
-        # Check if there's an existing pending email change request (rate limiting)
-        if redis_client.exists(redis_key):
-            time_remaining = redis_client.ttl(redis_key)
-            minutes_remaining = int(time_remaining / 60) + 1
+        # Check if there's an existing pending email change request (rate
+        # limiting); one TTL call covers existence too (-2 = key missing)
+        time_remaining = redis_client.ttl(redis_key)
+        if time_remaining > 0:
+            minutes_remaining = time_remaining // 60 + 1
             raise ValidationError(
                 f"Please wait {minutes_remaining} minutes before requesting another email change"
             )
 
-        # Generate two different OTPs - 6 digit numeric codes
-        current_email_otp = "".join(secrets.choice(string.digits) for _ in range(6))
-        new_email_otp = "".join(secrets.choice(string.digits) for _ in range(6))
-
-        # Store OTPs in Redis with expiration (eg. 15 minutes)
-        redis_client.setex(
-            redis_key, OTP_VALID_FOR, f"{new_email}:{current_email_otp}:{new_email_otp}"
-        )
+        # Generate two different OTPs - 6 digit numeric codes. One CSPRNG
+        # draw each (~20 bits) instead of six per-character choices
+        current_email_otp = f"{secrets.randbelow(1_000_000):06d}"
+        new_email_otp = f"{secrets.randbelow(1_000_000):06d}"
+
+        # Store the pending change as a hash (no delimiter packing to parse
+        # on verify); HSET and EXPIRE share one round-trip via the pipeline
+        with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(
+                redis_key,
+                mapping={
+                    "new_email": new_email,
+                    "cur_otp": current_email_otp,
+                    "new_otp": new_email_otp,
+                },
+            )
+            pipe.expire(redis_key, OTP_VALID_FOR)
+            pipe.execute()
 
         # Send different OTPs to each email address asynchronously
         send_email_change_otps.delay(
@@ -46,7 +58,10 @@ def request_email_change(user, new_email):
         )
 
         logger.info(
-            f"Email change OTPs sent for user {user.id}: {user.email} -> {new_email}"
+            "Email change OTPs sent for user %s: %s -> %s",
+            user.id,
+            user.email,
+            new_email,
         )
         return True
 
@@ -54,7 +69,7 @@ def request_email_change(user, new_email):
         # Pass through validation errors
         raise
     except Exception as e:
-        logger.error(f"Error requesting email change: {str(e)}", exc_info=True)
+        logger.error("Error requesting email change: %s", str(e), exc_info=True)
         raise Exception(
             f"An error occurred while processing the email change request: {str(e)}"
         )
@@ -76,32 +91,40 @@ def confirm_email_change(user, current_email_otp, new_email_otp):
         ValidationError: If verification fails
     """
     try:
-        # Get stored data from Redis
+        # Get stored data from Redis (hash written by request_email_change)
         redis_key = f"email_change:{user.id}"
-        stored_data = redis_client.get(redis_key)
+        stored_data = redis_client.hgetall(redis_key)
 
         if not stored_data:
             raise ValidationError("Otp is expired")
 
-        new_email, stored_current_otp, stored_new_otp = stored_data.split(":")
+        new_email = stored_data["new_email"]
+        stored_current_otp = stored_data["cur_otp"]
+        stored_new_otp = stored_data["new_otp"]
+
+        # Constant-time comparisons; both are evaluated before branching so
+        # response timing never reveals which OTP matched
+        current_otp_valid = hmac.compare_digest(current_email_otp, stored_current_otp)
+        new_otp_valid = hmac.compare_digest(new_email_otp, stored_new_otp)
 
-        if current_email_otp != stored_current_otp and new_email_otp != stored_new_otp:
+        if not current_otp_valid and not new_otp_valid:
             raise ValidationError("Both current and new email OTPs are incorrect.")
 
-        if current_email_otp != stored_current_otp:
+        if not current_otp_valid:
             raise ValidationError("Invalid current email otp")
 
-        if new_email_otp != stored_new_otp:
+        if not new_otp_valid:
             raise ValidationError("Invalid new email otp.")
 
         # Update email
         user.email = new_email
         db.session.commit()
+        invalidate_cached_user(user.id)  # Cached copy still has the old email
 
         # Delete Redis key
         redis_client.delete(redis_key)
 
-        logger.info(f"Email changed for user {user.id} to {new_email}")
+        logger.info("Email changed for user %s to %s", user.id, new_email)
         return True
 
     except ValidationError as e:
@@ -109,7 +132,7 @@ def confirm_email_change(user, current_email_otp, new_email_otp):
         raise
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error confirming email change: {str(e)}", exc_info=True)
+        logger.error("Error confirming email change: %s", str(e), exc_info=True)
         raise Exception(f"Failed to change email: {str(e)}")
 
 
@@ -125,18 +148,25 @@ def generate_staff_email_change_token(user, new_email):
 
     redis_ttl_key = f"staff_email_change_ttl:{user.id}"
 
-    if redis_client.exists(redis_ttl_key):
-        time_remaining = redis_client.ttl(redis_ttl_key)
-        minutes_remaining = int(time_remaining / 60)
+    # One TTL call covers both the existence check and the remaining time
+    time_remaining = redis_client.ttl(redis_ttl_key)
+    if time_remaining > 0:
+        minutes_remaining = time_remaining // 60
         raise ValidationError(
             f"Please wait {minutes_remaining} minutes before requesting another email change"
         )
 
-    redis_client.setex(redis_ttl_key, EMAIL_CHANGE_TOKEN_RESEND, "1")
-    redis_client.setex(redis_key, EMAIL_CHANGE_TOKEN_VALIDITY, f"{user.id}:{new_email}")
+    # Both keys are written in a single network round-trip
+    with redis_client.pipeline(transaction=False) as pipe:
+        pipe.setex(redis_ttl_key, EMAIL_CHANGE_TOKEN_RESEND, "1")
+        pipe.setex(redis_key, EMAIL_CHANGE_TOKEN_VALIDITY, f"{user.id}:{new_email}")
+        pipe.execute()
 
     logger.info(
-        f"Staff-initiated email change token generated for user {user.id}: {user.email} -> {new_email}"
+        "Staff-initiated email change token generated for user %s: %s -> %s",
+        user.id,
+        user.email,
+        new_email,
     )
     return token
 
@@ -173,12 +203,15 @@ def delete_user_account(current_user, target_user, password=None):
         # Perform soft delete
         target_user.is_deleted = True
         db.session.commit()
+        invalidate_cached_user(target_user.id)
 
         soft_delete_user_related_objects.delay(str(target_user.id))
 
         logger.info(
-            f"User account deleted - ID: {target_user.id}, Email: {target_user.email}, "
-            + f"Deleted by: {current_user.id}"
+            "User account deleted - ID: %s, Email: %s, Deleted by: %s",
+            target_user.id,
+            target_user.email,
+            current_user.id,
         )
 
         return True
@@ -188,5 +221,5 @@ def delete_user_account(current_user, target_user, password=None):
         raise
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error deleting user account: {str(e)}", exc_info=True)
+        logger.error("Error deleting user account: %s", str(e), exc_info=True)
         raise Exception(f"Failed to delete user account: {str(e)}")
@@ -1,13 +1,25 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+
+from app.extensions import db, bcrypt, redis_client
+from app.models.auth import ActiveAccessToken
+from app.models.user import User
 from app.utils.logger import logger
+from app.utils.tokens import TokenHandler
 from app.celery_app import celery
 from app.utils.email_helper import send_templated_email
 from app.utils.constants import (
-    ACCCOUNT_VERIFICATION_LINK_VALIDITY,
-    PASSWORD_RESET_LINK_VALIDITY,
+    ACCESS_TOKEN_REVOKED,
+    JWT_ACCESS_TOKEN_EXPIRES,
+    PASSWORD_RESET_EXPIRY_MINUTES,
+    VERIFICATION_EXPIRY_MINUTES,
 )
 
 
-@celery.task(name="send_verification_email", bind=True, max_retries=3)
+@celery.task(
+    name="send_verification_email", bind=True, max_retries=3, rate_limit="50/s"
+)
 def send_verification_email(self, email, verification_url):
     """
     Task to send a verification email asynchronously.
@@ -17,21 +29,20 @@ def send_verification_email(self, email, verification_url):
     """
     try:
         # Using templated email
-        expiry_minutes = int(ACCCOUNT_VERIFICATION_LINK_VALIDITY / 60)
         send_templated_email(
             recipient=email,
             subject="Verify Your Email - Expense Tracker",
             template="emails/auth/verification.html",
             verification_url=verification_url,
-            expiry_minutes=expiry_minutes,
+            expiry_minutes=VERIFICATION_EXPIRY_MINUTES,
         )
 
-        logger.info(f"Verification email sent successfully to {email}")
+        logger.info("Verification email sent successfully to %s", email)
         return True
 
     except Exception as e:
         logger.error(
-            f"Failed to send verification email to {email}: {str(e)}", exc_info=True
+            "Failed to send verification email to %s: %s", email, str(e), exc_info=True
         )
 
         # Retry with exponential backoff
@@ -39,7 +50,9 @@ def send_verification_email(self, email, verification_url):
         raise self.retry(exc=e, countdown=retry_in)
 
 
-@celery.task(name="send_password_reset_email", bind=True, max_retries=3)
+@celery.task(
+    name="send_password_reset_email", bind=True, max_retries=3, rate_limit="50/s"
+)
 def send_password_reset_email(self, email, reset_url):
     """
     Task to send a password reset email asynchronously.
@@ -49,23 +62,113 @@ def send_password_reset_email(self, email, reset_url):
     """
     try:
         # Using templated email
-        expiry_minutes = int(PASSWORD_RESET_LINK_VALIDITY / 60)
         send_templated_email(
             recipient=email,
             subject="Password Reset - Expense Tracker",
             template="emails/auth/password_reset.html",
             reset_url=reset_url,
-            expiry_minutes=expiry_minutes,
+            expiry_minutes=PASSWORD_RESET_EXPIRY_MINUTES,
         )
 
-        logger.info(f"Password reset email sent successfully to {email}")
+        logger.info("Password reset email sent successfully to %s", email)
         return True
 
     except Exception as e:
         logger.error(
-            f"Failed to send password reset email to {email}: {str(e)}", exc_info=True
+            "Failed to send password reset email to %s: %s",
+            email,
+            str(e),
+            exc_info=True,
         )
 
         # Retry with exponential backoff
         retry_in = 60 * (2**self.request.retries)  # 60s, 120s, 240s
         raise self.retry(exc=e, countdown=retry_in)
+
+
+@celery.task(name="finish_password_reset", bind=True, max_retries=3)
+def finish_password_reset(self, user_id, new_password):
+    """
+    Task to hash and store a new password after a verified reset request.
+
+    bcrypt at the configured cost blocks for hundreds of milliseconds, so
+    the hash and the write run on a worker instead of tying up an HTTP
+    request thread.
+    """
+    try:
+        password_hash = bcrypt.generate_password_hash(new_password).decode("utf-8")
+        row = db.session.execute(
+            update(User)
+            .where(User.id == user_id, User.is_deleted == False)
+            .values(password=password_hash)
+            .returning(User.email)
+        ).first()
+        if row is None:
+            db.session.rollback()
+            logger.warning("Password reset task: user %s not found", user_id)
+            return False
+        db.session.commit()
+
+        # Invalidate all existing tokens
+        TokenHandler.invalidate_user_access_tokens(user_id)
+
+        logger.info("Password reset completed for user: %s", row.email)
+        return True
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error("Error completing password reset: %s", str(e), exc_info=True)
+        # Retry with exponential backoff
+        retry_in = 60 * (2**self.request.retries)  # 60s, 120s, 240s
+        raise self.retry(exc=e, countdown=retry_in)
+
+
+@celery.task(name="store_active_token", bind=True, max_retries=3)
+def store_active_token(self, access_token, user_id):
+    """
+    Task to persist an issued access token to Postgres.
+
+    The Redis mirror written at issue time is authoritative for auth
+    checks, so this insert is an audit/invalidation record that does not
+    need to block the login response.
+    """
+    try:
+        # Revocation can win the race with this insert: a logout or bulk
+        # purge that found no row yet leaves a tombstone in the mirror.
+        # An expired/missing mirror means the same thing - in neither
+        # case may the row be (re)created
+        mirror = redis_client.get(f"at:{access_token}")
+        if mirror is None or mirror == ACCESS_TOKEN_REVOKED:
+            logger.info("Skipping store of revoked token for user %s", user_id)
+            return False
+
+        db.session.add(ActiveAccessToken(access_token=access_token, user_id=user_id))
+        db.session.commit()
+        logger.info("Stored active token for user %s", user_id)
+        return True
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error("Error storing active token: %s", str(e), exc_info=True)
+        # Retry with exponential backoff
+        retry_in = 60 * (2**self.request.retries)  # 60s, 120s, 240s
+        raise self.retry(exc=e, countdown=retry_in)
+
+
+@celery.task(name="purge_expired_access_tokens")
+def purge_expired_access_tokens():
+    """
+    Task to delete token rows whose JWT has already expired.
+
+    Rows are otherwise only removed on logout or password reset, so the
+    table grows without bound. The Redis mirrors expire on their own TTL
+    and need no cleanup. Runs hourly via beat; the created_at index turns
+    the sweep into a range scan.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRES)
+    deleted = ActiveAccessToken.query.filter(
+        ActiveAccessToken.created_at < cutoff
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    logger.info("Purged %s expired access token rows", deleted)
+    return deleted
@@ -1,15 +1,22 @@
-from app.extensions import mail, db
+from sqlalchemy import delete
+
+from app.extensions import mail, db, redis_client
 from app.utils.logger import logger
 from app.celery_app import celery
-from app.utils.constants import OTP_VALID_FOR, EMAIL_CHANGE_TOKEN_VALIDITY
-from app.utils.tokens import TokenHandler
+from app.utils.constants import (
+    OTP_VALID_FOR_MINUTES,
+    EMAIL_CHANGE_TOKEN_VALIDITY_HOURS,
+)
+from app.models.auth import ActiveAccessToken
 from app.models.user import User
+from app.utils.cache import invalidate_cached_user
+from app.utils.tokens import _user_tokens_key, tombstone_token_mirrors
 from app.utils.email_helper import send_templated_email
 from app.models.category import Category
 from app.models.transaction import Transaction
 
 
-@celery.task(name="send_email_change_otps", bind=True, max_retries=3)
+@celery.task(name="send_email_change_otps", bind=True, max_retries=3, rate_limit="50/s")
 def send_email_change_otps(
     self, current_email, new_email, current_email_otp, new_email_otp
 ):
@@ -17,45 +24,54 @@ def send_email_change_otps(
     Task to send different OTPs to current and new email addresses.
     """
     try:
-        # Calculate expiry minutes
-        expiry_minutes = int(OTP_VALID_FOR / 60)
-
-        # Send OTP to current email
-        send_templated_email(
-            recipient=current_email,
-            subject="Verify Your Email Change Request - Expense Tracker",
-            template="emails/user/current_email_otp.html",
-            otp=current_email_otp,
-            expiry_minutes=expiry_minutes,
-        )
-
-        # Send different OTP to new email
-        send_templated_email(
-            recipient=new_email,
-            subject="Verify Your New Email Address - Expense Tracker",
-            template="emails/user/new_email_otp.html",
-            otp=new_email_otp,
-            expiry_minutes=expiry_minutes,
-        )
-
-        logger.info(f"Email change OTPs sent to {current_email} and {new_email}")
+        expiry_minutes = OTP_VALID_FOR_MINUTES
+
+        # Both messages go over one authenticated SMTP session; opening a
+        # fresh connection per send would pay the TCP+TLS+AUTH handshake
+        # twice for what is otherwise pure I/O wait
+        with mail.connect() as conn:
+            # Send OTP to current email
+            send_templated_email(
+                recipient=current_email,
+                subject="Verify Your Email Change Request - Expense Tracker",
+                template="emails/user/current_email_otp.html",
+                connection=conn,
+                otp=current_email_otp,
+                expiry_minutes=expiry_minutes,
+            )
+
+            # Send different OTP to new email
+            send_templated_email(
+                recipient=new_email,
+                subject="Verify Your New Email Address - Expense Tracker",
+                template="emails/user/new_email_otp.html",
+                connection=conn,
+                otp=new_email_otp,
+                expiry_minutes=expiry_minutes,
+            )
+
+        logger.info("Email change OTPs sent to %s and %s", current_email, new_email)
         return True
 
     except Exception as e:
-        logger.error(f"Failed to send email change OTPs: {str(e)}", exc_info=True)
+        logger.error("Failed to send email change OTPs: %s", str(e), exc_info=True)
         # Retry with exponential backoff
         retry_in = 60 * (2**self.request.retries)  # 60s, 120s, 240s
         raise self.retry(exc=e, countdown=retry_in)
 
 
-@celery.task(name="send_staff_email_change_verification", bind=True, max_retries=3)
+@celery.task(
+    name="send_staff_email_change_verification",
+    bind=True,
+    max_retries=3,
+    rate_limit="50/s",
+)
 def send_staff_email_change_verification(self, new_email, verification_url, username):
     """
     Send verification email for staff-initiated email change.
     """
     try:
-        # Calculate expiry hours
-        expiry_hours = int(EMAIL_CHANGE_TOKEN_VALIDITY / 3600)
+        expiry_hours = EMAIL_CHANGE_TOKEN_VALIDITY_HOURS
 
         send_templated_email(
             recipient=new_email,
@@ -66,11 +82,11 @@ def send_staff_email_change_verification(self, new_email, verification_url, user
             expiry_hours=expiry_hours,
         )
 
-        logger.info(f"Email change verification sent to {new_email}")
+        logger.info("Email change verification sent to %s", new_email)
         return True
 
     except Exception as e:
-        logger.error(f"Error sending verification email: {str(e)}", exc_info=True)
+        logger.error("Error sending verification email: %s", str(e), exc_info=True)
         # Retry with exponential backoff
         retry_in = 60 * (2**self.request.retries)  # 60s, 120s, 240s
         raise self.retry(exc=e, countdown=retry_in)
@@ -86,33 +102,50 @@ def soft_delete_user_related_objects(self, user_id):
         user_id: UUID of the user that was deleted
     """
     try:
-        logger.info(f"Starting cleanup for user {user_id}")
-        TokenHandler.invalidate_user_access_tokens(user_id)
-
-        categories_deleted = Category.query.filter_by(
-            user_id=user_id, is_deleted=False
-        ).update(
-            {"is_deleted": True},
+        logger.info("Starting cleanup for user %s", user_id)
+
+        # All three set-based statements ride one transaction with a single
+        # commit (one fsync) instead of committing per step; the token
+        # delete is inlined rather than calling
+        # TokenHandler.invalidate_user_access_tokens, which commits itself.
+        # The per-user Redis set also covers tokens whose deferred insert
+        # has not landed, so union it with the RETURNING rows and
+        # tombstone every mirror after the commit
+        issued = redis_client.smembers(_user_tokens_key(user_id))
+        token_rows = db.session.execute(
+            delete(ActiveAccessToken)
+            .where(ActiveAccessToken.user_id == user_id)
+            .returning(ActiveAccessToken.access_token)
+        ).all()
+        logger.info("Deleted %s access tokens for user %s", len(token_rows), user_id)
+
+        categories_deleted = Category.bulk_soft_delete(
+            Category.query.filter_by(user_id=user_id, is_deleted=False)
+        )
+        logger.info(
+            "Soft deleted %s categories for user %s", categories_deleted, user_id
         )
-        logger.info(f"Soft deleted {categories_deleted} categories for user {user_id}")
 
         # Soft delete all user's transactions
-        transactions_deleted = Transaction.query.filter_by(
-            user_id=user_id, is_deleted=False
-        ).update(
-            {"is_deleted": True},
+        transactions_deleted = Transaction.bulk_soft_delete(
+            Transaction.query.filter_by(user_id=user_id, is_deleted=False)
         )
         logger.info(
-            f"Soft deleted {transactions_deleted} transactions for user {user_id}"
+            "Soft deleted %s transactions for user %s", transactions_deleted, user_id
         )
 
         db.session.commit()
-        logger.info(f"Cleanup completed for user {user_id}")
+        revoked = {row.access_token for row in token_rows} | issued
+        pipe = tombstone_token_mirrors(revoked)
+        pipe.delete(_user_tokens_key(user_id))
+        pipe.execute()
+        invalidate_cached_user(user_id)
+        logger.info("Cleanup completed for user %s", user_id)
         return True
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error in user cleanup: {str(e)}", exc_info=True)
+        logger.error("Error in user cleanup: %s", str(e), exc_info=True)
         # Retry with exponential backoff
         retry_in = 60 * (2**self.request.retries)  # 60s, 120s, 240s
         raise self.retry(exc=e, countdown=retry_in)
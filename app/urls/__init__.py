@@ -1,3 +1,11 @@
+import flask_restful
+
+from app.utils.json_provider import output_json
+
+# Every Api instance copies DEFAULT_REPRESENTATIONS at construction, so the
+# orjson representation must be installed before the url modules build them
+flask_restful.DEFAULT_REPRESENTATIONS = [("application/json", output_json)]
+
 from app.urls.auth import auth_bp
 from app.urls.user import user_bp
 from app.urls.category import category_bp
@@ -32,9 +32,3 @@ user_api.add_resource(
 user_api.add_resource(
     EmailChangeVerifyTokenResource, "/api/verify-email/<token>", endpoint="verify-email"
 )
-
-user_api.add_resource(
-    EmailChangeConfirmResource,
-    "/me/email-change/confirm",
-    endpoint="email-change-confirm",
-)
@@ -0,0 +1,66 @@
+import json
+import uuid
+
+from app.extensions import redis_client
+from app.models.user import User
+from app.utils.constants import USER_CACHE_TTL
+from app.utils.logger import logger
+
+
+def _user_cache_key(user_id):
+    return f"user:{user_id}"
+
+
+def _serialize_user(user):
+    """Serialize the lightweight user fields needed on the request path."""
+    return json.dumps(
+        {
+            "id": str(user.id),
+            "username": user.username,
+            "email": user.email,
+            "name": user.name,
+            "is_staff": user.is_staff,
+            "is_verified": user.is_verified,
+            "is_deleted": user.is_deleted,
+        }
+    )
+
+
+def _deserialize_user(cached):
+    """Rebuild a detached User instance from its cached representation."""
+    data = json.loads(cached)
+    user = User(
+        username=data["username"],
+        email=data["email"],
+        name=data["name"],
+        is_staff=data["is_staff"],
+        is_verified=data["is_verified"],
+        is_deleted=data["is_deleted"],
+    )
+    user.id = uuid.UUID(data["id"])
+    return user
+
+
+def get_cached_user(user_id):
+    """
+    Fetch a user by id through the Redis cache.
+
+    On a cache hit this replaces the per-request Postgres round-trip with a
+    single Redis GET; on a miss the user is loaded from the database and
+    cached with a short TTL.
+    """
+    key = _user_cache_key(user_id)
+    cached = redis_client.get(key)
+    if cached:
+        logger.debug("User cache hit for %s", user_id)
+        return _deserialize_user(cached)
+
+    user = User.query.get(user_id)
+    if user:
+        redis_client.setex(key, USER_CACHE_TTL, _serialize_user(user))
+    return user
+
+
+def invalidate_cached_user(user_id):
+    """Drop the cached user entry (call whenever user state changes)."""
+    redis_client.delete(_user_cache_key(user_id))
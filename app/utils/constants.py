@@ -4,6 +4,11 @@ import enum
 JWT_ACCESS_TOKEN_EXPIRES = 60  # in minutes
 JWT_REFRESH_TOKEN_EXPIRES = 30  # in days
 
+# Sentinel stored in an at:{token} mirror when the token is revoked before
+# its deferred DB insert has landed; honored by the auth path and by the
+# store_active_token task so a revoked token can never be re-persisted
+ACCESS_TOKEN_REVOKED = "revoked"
+
 
 PASSWORD_RESET_LINK_SEND_RATE_LIMIT = 600  # Rate limiting period in seconds
 PASSWORD_RESET_LINK_VALIDITY = 900  # in seconds
@@ -11,11 +16,19 @@ PASSWORD_RESET_LINK_VALIDITY = 900  # in seconds
 ACCCOUNT_VERIFICATION_LINK_SEND_RATE_LIMIT = 600  # in seconds
 ACCCOUNT_VERIFICATION_LINK_VALIDITY = 3600  # in seconds
 
+# Minute renditions used in email templates, derived once at import
+PASSWORD_RESET_EXPIRY_MINUTES = PASSWORD_RESET_LINK_VALIDITY // 60
+VERIFICATION_EXPIRY_MINUTES = ACCCOUNT_VERIFICATION_LINK_VALIDITY // 60
+
 
 OTP_VALID_FOR = 300  # in seconds
 EMAIL_CHANGE_TOKEN_VALIDITY = 12 * 3600  # in seconds
 EMAIL_CHANGE_TOKEN_RESEND = 600  # in seconds
 
+# Template-facing renditions, derived once at import
+OTP_VALID_FOR_MINUTES = OTP_VALID_FOR // 60
+EMAIL_CHANGE_TOKEN_VALIDITY_HOURS = EMAIL_CHANGE_TOKEN_VALIDITY // 3600
+
 
 # for categories
 CATEGORY_NAME_MIN_LENGTH = 1
@@ -33,6 +46,13 @@ class TransactionType(enum.Enum):
 AMOUNT_MIN_VALUE = 1
 AMOUNT_MAX_VALUE = 99999999.99
 
+# Cached user entries (seconds) - bounds staleness of g.user data
+USER_CACHE_TTL = 60
+
+# Cached predefined category listing (seconds) - the set rarely changes and
+# the cache is invalidated on every predefined-category mutation anyway
+PREDEFINED_CATEGORY_CACHE_TTL = 3600
+
 # Pagination defaults
 DEFAULT_PAGE_SIZE = 10
 MAX_PAGE_SIZE = 100
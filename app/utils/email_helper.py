@@ -1,10 +1,72 @@
-from flask import render_template, current_app
+import smtplib
+import threading
+from flask import current_app
 from flask_mail import Message
+from celery.signals import worker_process_shutdown
 from app.extensions import mail
+from app.utils.logger import logger
 from datetime import datetime
 
+# Compiled Jinja Template objects keyed by path. The handful of email
+# templates never changes at runtime, so each is loaded once per process
+# and re-rendered directly, skipping the loader walk and the render
+# signals that flask.render_template runs on every call
+_template_cache = {}
 
-def send_templated_email(recipient, subject, template, **context):
+
+def _render_cached_template(template, **context):
+    """Render an email template through the process-level template cache."""
+    tmpl = _template_cache.get(template)
+    if tmpl is None:
+        tmpl = current_app.jinja_env.get_template(template)
+        _template_cache[template] = tmpl
+    return tmpl.render(**context)
+
+
+# One SMTP session per worker thread, opened lazily and reused across
+# sends, so sequential email tasks in the same worker skip the
+# TCP+TLS+AUTH handshake that flask-mail otherwise pays per message
+_smtp_local = threading.local()
+
+
+def _get_pooled_connection():
+    """Return an open, healthy flask_mail Connection for this thread."""
+    conn = getattr(_smtp_local, "connection", None)
+    if conn is not None:
+        try:
+            # NOOP doubles as a keepalive and a health check; a dead
+            # session raises and we fall through to reconnect
+            if conn.host is not None:
+                conn.host.noop()
+            return conn
+        except (smtplib.SMTPException, OSError):
+            logger.info("Pooled SMTP connection went stale, reconnecting")
+            _close_pooled_connection()
+
+    conn = mail.connect()
+    conn.__enter__()
+    _smtp_local.connection = conn
+    return conn
+
+
+def _close_pooled_connection():
+    """Close this thread's pooled SMTP connection, if any."""
+    conn = getattr(_smtp_local, "connection", None)
+    if conn is not None:
+        _smtp_local.connection = None
+        try:
+            conn.__exit__(None, None, None)
+        except Exception:
+            pass
+
+
+@worker_process_shutdown.connect
+def _shutdown_smtp_pool(**kwargs):
+    """Quit any open SMTP session when a Celery worker process exits."""
+    _close_pooled_connection()
+
+
+def send_templated_email(recipient, subject, template, connection=None, **context):
     """
     Send an email using a template.
 
@@ -12,16 +74,28 @@ def send_templated_email(recipient, subject, template, **context):
         recipient (str): Recipient's email address
         subject (str): Email subject
         template (str): Path to template file
+        connection: Optional open flask_mail Connection; when sending
+            several emails in one task, passing a shared connection reuses
+            the SMTP session instead of paying the TCP+TLS+AUTH handshake
+            per message
         **context: Context variables for the template
     """
     # Add current year for copyright in footer
     context["current_year"] = datetime.now().year
 
     # Render HTML content
-    html_content = render_template(template, **context)
+    html_content = _render_cached_template(template, **context)
 
     # Create message
     msg = Message(subject=subject, recipients=[recipient], html=html_content)
 
-    # Send email
-    mail.send(msg)
+    # Send email over the caller's connection or the pooled session;
+    # retry once through a fresh connection if the session died mid-send
+    if connection is not None:
+        connection.send(msg)
+    else:
+        try:
+            _get_pooled_connection().send(msg)
+        except (smtplib.SMTPException, OSError):
+            _close_pooled_connection()
+            _get_pooled_connection().send(msg)
@@ -18,13 +18,13 @@ def handle_error(app):
         elif isinstance(error.messages, list):
             formatted_errors = error.messages[0] if len(error.messages) > 0 else "error"
 
-        logger.warning(f"Validation error: {formatted_errors}")
+        logger.warning("Validation error: %s", formatted_errors)
         return {"error": formatted_errors}, 400
 
     @app.errorhandler(404)
     def handle_not_found(error):
         """Handle 404 Not Found errors"""
-        logger.info(f"Resource not found: {str(error)}")
+        logger.info("Resource not found: %s", str(error))
         return {
             "error": "The requested resource was not found",
         }, 404
@@ -32,7 +32,7 @@ def handle_error(app):
     @app.errorhandler(403)
     def handle_forbidden(error):
         """Handle 403 Forbidden errors"""
-        logger.info(f"Permission denied: {str(error)}")
+        logger.info("Permission denied: %s", str(error))
         return {
             "error": "Forbidden, you do not have permission to access this resource",
         }, 403
@@ -40,13 +40,13 @@ def handle_error(app):
     @app.errorhandler(401)
     def handle_unauthorized(error):
         """Handle 401 Unauthorized errors (e.g., JWT issues)"""
-        logger.info(f"Unauthorized access: {str(error)}")
+        logger.info("Unauthorized access: %s", str(error))
         return {"error": "Unauthorized, Authentication required"}, 401
 
     # Handle Redis connection errors
     @app.errorhandler(redis.RedisError)
     def handle_redis_error(e):
-        logger.error(f"Redis error: {str(e)}", exc_info=True)
+        logger.error("Redis error: %s", str(e), exc_info=True)
 
         # In production, don't expose specific Redis errors to clients
         if current_app.config.get("ENV") == "production":
@@ -62,7 +62,7 @@ def handle_error(app):
     @app.errorhandler(Exception)
     def handle_generic_exception(error):
         """Handle all other unhandled exceptions"""
-        logger.error(f"Unhandled exception: {str(error)}", exc_info=True)
+        logger.error("Unhandled exception: %s", str(error), exc_info=True)
         return {
             "error": "Internal Server Error",
             "detail": str(error),
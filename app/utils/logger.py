@@ -1,5 +1,8 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import smtplib
 
 # Create logs directory if it doesn't exist
@@ -11,15 +14,34 @@ if not os.path.exists(LOG_DIR):
 logging.getLogger("smtplib").setLevel(logging.WARNING)  # Adjust this as needed
 logging.getLogger("email").setLevel(logging.WARNING)  # Suppress email-related logs
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,  # This is the level for your application's logs (can be DEBUG for more details)
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),  # Console handler
-        logging.FileHandler(os.path.join(LOG_DIR, "app.log")),  # File handler if needed
-    ],
+# Request/task threads only enqueue records (a cheap, non-blocking put);
+# the QueueListener thread does the actual console and disk writes, so a
+# slow disk never stalls the hot path
+_log_queue = queue.Queue(-1)
+
+_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+_stream_handler = logging.StreamHandler()  # Console handler
+_stream_handler.setFormatter(_formatter)
+
+_file_handler = logging.FileHandler(os.path.join(LOG_DIR, "app.log"))
+_file_handler.setFormatter(_formatter)
+
+_listener = logging.handlers.QueueListener(
+    _log_queue, _stream_handler, _file_handler, respect_handler_level=True
 )
+_listener.start()
+# Flush queued records before the interpreter exits
+atexit.register(_listener.stop)
+
+# Configure logging. The queue handler is attached directly (not via
+# basicConfig, which would stamp its format onto it and double-format
+# every record once the listener's handlers format it again)
+_root = logging.getLogger()
+_root.setLevel(
+    logging.INFO
+)  # This is the level for your application's logs (can be DEBUG for more details)
+_root.addHandler(logging.handlers.QueueHandler(_log_queue))
 
 # Create logger instance
 logger = logging.getLogger(__name__)
@@ -1,6 +1,12 @@
+import base64
+import uuid
+from datetime import datetime
+
 from flask import request, url_for
+from marshmallow import ValidationError
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Query
-from app.utils.constants import MAX_PAGE_SIZE
+from app.utils.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 
 class PaginatedResult:
@@ -9,7 +15,7 @@ class PaginatedResult:
     Handles paginating SQLAlchemy queries and formatting response.
     """
 
-    def __init__(self, query, page=1, per_page=10, error_out=False):
+    def __init__(self, query, page=1, per_page=10, error_out=False, count=True):
         """
         Initialize paginator with query and pagination parameters.
 
@@ -18,26 +24,37 @@ class PaginatedResult:
             page: Current page number (default: 1)
             per_page: Items per page (default: 10)
             error_out: Whether to raise 404 when out of range (default: False)
+            count: Whether to issue the COUNT(*) query for totals. Pass
+                False on large tables: has_next is then probed by fetching
+                one extra row, which avoids an O(N) count scan per page at
+                the cost of omitting total_items/total_pages
         """
         self.query = query
         self.page = page
         self.per_page = per_page
         self.error_out = error_out
 
-        # Get paginated items
-        self.pagination = query.paginate(
-            page=page, per_page=per_page, error_out=error_out
-        )
+        if count:
+            pagination = query.paginate(
+                page=page, per_page=per_page, error_out=error_out
+            )
+            self._items = pagination.items
+            self.total = pagination.total
+            self.pages = pagination.pages
+            self.has_next = pagination.has_next
+        else:
+            # One extra row answers has_next without counting the table
+            rows = query.limit(per_page + 1).offset((page - 1) * per_page).all()
+            self._items = rows[:per_page]
+            self.total = None
+            self.pages = None
+            self.has_next = len(rows) > per_page
+        self.has_prev = page > 1
 
     @property
     def items(self):
         """Get current page items"""
-        return self.pagination.items
-
-    @property
-    def total(self):
-        """Get total number of items"""
-        return self.pagination.total
+        return self._items
 
     def to_dict(self, schema, endpoint=None, **kwargs):
         """
@@ -54,15 +71,16 @@ class PaginatedResult:
         # Serialize items with provided schema
         serialized_items = schema.dump(self.items)
 
-        # Build pagination metadata
+        # Build pagination metadata; totals are absent in countless mode
         pagination_data = {
-            "total_items": self.pagination.total,
-            "total_pages": self.pagination.pages,
             "current_page": self.page,
             "per_page": self.per_page,
-            "has_next": self.pagination.has_next,
-            "has_prev": self.pagination.has_prev,
+            "has_next": self.has_next,
+            "has_prev": self.has_prev,
         }
+        if self.total is not None:
+            pagination_data["total_items"] = self.total
+            pagination_data["total_pages"] = self.pages
 
         # Add page navigation links if endpoint is provided
         if endpoint:
@@ -74,35 +92,36 @@ class PaginatedResult:
     def _get_pagination_links(self, endpoint, **kwargs):
         """
         Generate pagination links for different pages.
-        """
-        links = {}
 
-        # Add parameters that should be included in all links
+        url_for resolves the routing map and server name on every call, so
+        it runs once here; the per-page links differ only in their page
+        argument and are composed with plain string formatting.
+        """
+        # Parameters shared by every link except the page number
         params = kwargs.copy()
         params["per_page"] = self.per_page
+        base = url_for(endpoint, **params, _external=True)
+        separator = "&" if "?" in base else "?"
 
-        # First page link
-        params["page"] = 1
-        links["first"] = url_for(endpoint, **params, _external=True)
+        def page_link(page):
+            return f"{base}{separator}page={page}"
 
-        # Last page link
-        params["page"] = self.pagination.pages
-        links["last"] = url_for(endpoint, **params, _external=True)
+        links = {"first": page_link(1)}
 
-        # Previous page link
-        if self.pagination.has_prev:
-            params["page"] = self.page - 1
-            links["prev"] = url_for(endpoint, **params, _external=True)
+        # No last link without a total page count (countless mode)
+        if self.pages is not None:
+            links["last"] = page_link(self.pages)
 
-        # Next page link
-        if self.pagination.has_next:
-            params["page"] = self.page + 1
-            links["next"] = url_for(endpoint, **params, _external=True)
+        if self.has_prev:
+            links["prev"] = page_link(self.page - 1)
+
+        if self.has_next:
+            links["next"] = page_link(self.page + 1)
 
         return links
 
 
-def paginate(query, schema, endpoint=None, **kwargs):
+def paginate(query, schema, endpoint=None, count=True, **kwargs):
     """
     Helper function to paginate a query and return standardized results.
 
@@ -110,6 +129,8 @@ def paginate(query, schema, endpoint=None, **kwargs):
         query: SQLAlchemy query object
         schema: Marshmallow schema for serializing items
         endpoint: Optional endpoint name for generating navigation URLs
+        count: Pass False to skip the COUNT(*) on large tables; the
+            response then omits total_items/total_pages and the last link
         **kwargs: Additional parameters (page, per_page, and URL params)
 
     Returns:
@@ -123,7 +144,113 @@ def paginate(query, schema, endpoint=None, **kwargs):
     per_page = min(max(per_page, 1), MAX_PAGE_SIZE)  # Between 1 and 100
 
     # Create paginated result
-    paginated_result = PaginatedResult(query, page, per_page)
+    paginated_result = PaginatedResult(query, page, per_page, count=count)
 
     # Return formatted result
     return paginated_result.to_dict(schema, endpoint, **kwargs)
+
+
+def paginate_list(items, **kwargs):
+    """
+    Paginate an in-memory list of already-serialized items.
+
+    Used for small cached result sets (e.g. the predefined categories)
+    where the page never needs to touch the database.
+
+    Args:
+        items: List of serialized items
+        **kwargs: Optional page / per_page overrides
+
+    Returns:
+        Dictionary with items and pagination metadata
+    """
+    page = kwargs.pop("page", request.args.get("page", 1, type=int))
+    per_page = kwargs.pop(
+        "per_page", request.args.get("per_page", DEFAULT_PAGE_SIZE, type=int)
+    )
+    per_page = min(max(per_page, 1), MAX_PAGE_SIZE)
+    page = max(page, 1)
+
+    total = len(items)
+    total_pages = (total + per_page - 1) // per_page
+    start = (page - 1) * per_page
+
+    return {
+        "items": items[start : start + per_page],
+        "pagination": {
+            "total_items": total,
+            "total_pages": total_pages,
+            "current_page": page,
+            "per_page": per_page,
+            "has_next": page < total_pages,
+            "has_prev": page > 1,
+        },
+    }
+
+
+def encode_cursor(timestamp, row_id):
+    """Encode a (timestamp, id) pair into an opaque cursor string."""
+    raw = f"{timestamp.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Decode a cursor back into its (timestamp, id) pair."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        ts_raw, id_raw = raw.split("|")
+        return datetime.fromisoformat(ts_raw), uuid.UUID(id_raw)
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid cursor")
+
+
+def keyset_paginate(query, schema, timestamp_col, id_col, cursor=None, per_page=None):
+    """
+    Paginate a query with a keyset cursor instead of LIMIT/OFFSET.
+
+    Each page is an O(per_page) index range scan on (timestamp, id)
+    regardless of page depth, and no COUNT(*) is emitted - has_next is
+    probed by fetching one extra row.
+
+    Args:
+        query: SQLAlchemy query object
+        schema: Marshmallow schema for serializing items
+        timestamp_col: Timestamp column forming the cursor (descending order)
+        id_col: Unique id column used as tie-breaker
+        cursor: Opaque cursor from a previous response (None for first page)
+        per_page: Items per page (defaults to request arg or DEFAULT_PAGE_SIZE)
+
+    Returns:
+        Dictionary with items and cursor pagination metadata
+    """
+    if per_page is None:
+        per_page = request.args.get("per_page", DEFAULT_PAGE_SIZE, type=int)
+    per_page = min(max(per_page, 1), MAX_PAGE_SIZE)
+
+    # Replace any ordering from the caller with the cursor ordering
+    query = query.order_by(None).order_by(timestamp_col.desc(), id_col.desc())
+
+    if cursor:
+        ts, row_id = decode_cursor(cursor)
+        query = query.filter(tuple_(timestamp_col, id_col) < (ts, row_id))
+
+    # Fetch one extra row to detect whether another page exists
+    rows = query.limit(per_page + 1).all()
+    has_next = len(rows) > per_page
+    items = rows[:per_page]
+
+    next_cursor = None
+    if has_next:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            getattr(last, timestamp_col.key), getattr(last, id_col.key)
+        )
+
+    return {
+        "items": schema.dump(items),
+        "pagination": {
+            "per_page": per_page,
+            "has_next": has_next,
+            "next_cursor": next_cursor,
+        },
+    }
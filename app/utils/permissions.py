@@ -3,10 +3,11 @@ from flask import jsonify, request, g
 from functools import wraps
 from app.models.user import User
 from app.models.auth import ActiveAccessToken
-import uuid
 from app.utils.logger import logger
-from app.utils.validators import is_valid_uuid
-from app.extensions import db
+from app.utils.validators import parse_uuid
+from app.utils.cache import get_cached_user
+from app.utils.constants import ACCESS_TOKEN_REVOKED, JWT_ACCESS_TOKEN_EXPIRES
+from app.extensions import db, redis_client
 
 
 def authenticated_user():
@@ -30,20 +31,44 @@ def authenticated_user():
                 )
 
             token = auth_header.split(" ")[1]
-            token_entry = ActiveAccessToken.query.filter_by(access_token=token).first()
-            if not token_entry:
+            # Hot path: the token->user_id mapping is mirrored in Redis at
+            # issue time, so most requests never touch Postgres here. On a
+            # cache miss (e.g. Redis restart) fall back to a narrow
+            # single-column SELECT and backfill the mirror
+            cache_key = f"at:{token}"
+            user_id = redis_client.get(cache_key)
+            if user_id == ACCESS_TOKEN_REVOKED:
+                # Tombstoned by a revocation that raced the deferred DB
+                # insert; do not fall through to the DB or backfill
+                logger.warning("Authentication failed: Token '%s' was revoked", token)
+                return (
+                    {"error": "Invalid authorization detail."},
+                    401,
+                )
+            if not user_id:
+                user_id = (
+                    db.session.query(ActiveAccessToken.user_id)
+                    .filter_by(access_token=token)
+                    .scalar()
+                )
+                if user_id:
+                    redis_client.setex(
+                        cache_key, JWT_ACCESS_TOKEN_EXPIRES * 60, str(user_id)
+                    )
+            if not user_id:
                 logger.error(
-                    f"Authentication failed: Token '{token}' not found in ActiveAccessToken"
+                    "Authentication failed: Token '%s' not found in ActiveAccessToken",
+                    token,
                 )
                 return (
                     {"error": "Invalid authorization detail."},
                     401,
                 )
 
-            user = token_entry.user
+            user = get_cached_user(user_id)
             if not user:
                 logger.error(
-                    f"Authentication failed: No user associated with token '{token}'"
+                    "Authentication failed: No user associated with token '%s'", token
                 )
                 return (
                     {
@@ -53,7 +78,7 @@ def authenticated_user():
                 )
 
             g.user = user
-            logger.info(f"User authenticated successfully: {user.id}")
+            logger.info("User authenticated successfully: %s", user.id)
             return fn(*args, **kwargs)
 
         return wrapper
@@ -71,18 +96,24 @@ def object_permission(model_class, id_param="id", check_fn=None):
         def wrapper(*args, **kwargs):
             object_id = kwargs.get(id_param)
             if not object_id:
-                logger.warning(f"Missing {id_param} in request")
+                logger.warning("Missing %s in request", id_param)
                 return {"error": "Missing object ID"}, 400
 
-            try:
-                object_id = uuid.UUID(object_id)
-            except ValueError:
-                logger.warning(f"Invalid {id_param} format: {object_id}")
+            # One gate-and-parse: no exception frame on the invalid path,
+            # no second pass over the string on the valid one
+            object_id = parse_uuid(object_id)
+            if object_id is None:
+                logger.warning("Invalid %s format: %s", id_param, kwargs.get(id_param))
                 return {"error": f"Invalid {id_param} format"}, 400
 
-            obj = model_class.query.get(object_id)
+            # Deleted rows must stay visible here: the permission checks
+            # below decide per-role what to do with them (staff can GET
+            # soft-deleted objects), so opt out of the global filter
+            obj = model_class.query.execution_options(include_deleted=True).get(
+                object_id
+            )
             if not obj:
-                logger.error(f"{model_class.__name__} not found for ID: {object_id}")
+                logger.error("%s not found for ID: %s", model_class.__name__, object_id)
                 return {"error": f"{model_class.__name__} not found."}, 404
 
             request_user = g.user
@@ -105,13 +136,20 @@ def object_permission(model_class, id_param="id", check_fn=None):
 
             if not has_permission:
                 logger.error(
-                    f"Permission denied for user {request_user.id} on {model_class.__name__} {obj.id}"
+                    "Permission denied for user %s on %s %s",
+                    request_user.id,
+                    model_class.__name__,
+                    obj.id,
                 )
                 return {"error": f"{model_class.__name__} not found"}, 404
 
             g.object = obj
             logger.info(
-                f"Permission granted for user {request_user.id} on {model_class.__name__} {obj.id} ({request_method})"
+                "Permission granted for user %s on %s %s (%s)",
+                request_user.id,
+                model_class.__name__,
+                obj.id,
+                request_method,
             )
             return fn(*args, **kwargs)
 
@@ -130,12 +168,12 @@ def staff_required():
         def wrapper(*args, **kwargs):
             if not g.user.is_staff:
                 logger.error(
-                    f"Staff access denied for user {g.user.id}: Not a staff member"
+                    "Staff access denied for user %s: Not a staff member", g.user.id
                 )
                 return {
                     "error": "Permission denied",
                 }, 403
-            logger.info(f"Staff access granted for user {g.user.id}")
+            logger.info("Staff access granted for user %s", g.user.id)
             return fn(*args, **kwargs)
 
         return wrapper
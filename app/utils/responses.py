@@ -11,5 +11,5 @@ def validation_error_response(error):
     elif isinstance(error.messages, list):
         formatted_errors = error.messages[0] if len(error.messages) > 0 else "error"
 
-    logger.warning(f"Data validation error: {formatted_errors}")
+    logger.warning("Data validation error: %s", formatted_errors)
     return {"error": formatted_errors}, 400
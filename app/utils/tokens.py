@@ -1,12 +1,16 @@
 import secrets
 from datetime import timedelta
 
+from sqlalchemy import delete
+
 from flask_jwt_extended import create_access_token, create_refresh_token
 
 from app.models.auth import ActiveAccessToken
 from app.extensions import db, redis_client
+from app.utils.cache import _user_cache_key
 from app.utils.logger import logger
 from app.utils.constants import (
+    ACCESS_TOKEN_REVOKED,
     PASSWORD_RESET_LINK_SEND_RATE_LIMIT,
     PASSWORD_RESET_LINK_VALIDITY,
     JWT_ACCESS_TOKEN_EXPIRES,
@@ -14,6 +18,26 @@ from app.utils.constants import (
 )
 
 
+def _user_tokens_key(user_id):
+    return f"ut:{user_id}"
+
+
+def tombstone_token_mirrors(tokens):
+    """Overwrite the at:{token} mirrors for revoked tokens with a sentinel.
+
+    The DB insert for a token is deferred to a Celery task, so revocation
+    cannot rely on rows existing yet. The tombstone (written only where a
+    mirror still lives, keeping its TTL) makes the auth path reject the
+    token immediately and tells a late store_active_token not to
+    re-persist it. Returns the pipeline for callers that want to append
+    more commands before executing.
+    """
+    pipe = redis_client.pipeline(transaction=False)
+    for token in tokens:
+        pipe.set(f"at:{token}", ACCESS_TOKEN_REVOKED, xx=True, keepttl=True)
+    return pipe
+
+
 class TokenHandler:
     """
     Utility class to handle token-related operations for Flask.
@@ -22,14 +46,32 @@ class TokenHandler:
     @staticmethod
     def generate_access_token(user, fresh):
         """Generate access token for a user"""
+        return TokenHandler.generate_access_token_for_id(user.id, fresh)
+
+    @staticmethod
+    def generate_access_token_for_id(user_id, fresh):
+        """Generate access token from a user id without loading the user row"""
         access_token = create_access_token(
-            identity=str(user.id),
+            identity=str(user_id),
             fresh=fresh,  # This is not a fresh login
             expires_delta=timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRES),
         )
-        token_entry = ActiveAccessToken(access_token=access_token, user_id=user.id)
-        db.session.add(token_entry)
-        db.session.commit()
+        # The Redis mirror is authoritative for auth checks, so write it
+        # synchronously (TTL matches the JWT) and defer the Postgres
+        # insert to a worker - login no longer waits on a DB fsync. The
+        # per-user set lets bulk revocation find every issued token even
+        # when its insert is still queued; refreshing the set's TTL on
+        # each issue keeps it alive at least as long as any member token
+        ttl = JWT_ACCESS_TOKEN_EXPIRES * 60
+        with redis_client.pipeline(transaction=False) as pipe:
+            pipe.setex(f"at:{access_token}", ttl, str(user_id))
+            pipe.sadd(_user_tokens_key(user_id), access_token)
+            pipe.expire(_user_tokens_key(user_id), ttl)
+            pipe.execute()
+        # Imported here because app.tasks.auth imports TokenHandler
+        from app.tasks.auth import store_active_token
+
+        store_active_token.delay(access_token, str(user_id))
         return access_token
 
     @staticmethod
@@ -38,6 +80,9 @@ class TokenHandler:
         refresh_token = create_refresh_token(
             identity=str(user.id),
             expires_delta=timedelta(days=JWT_REFRESH_TOKEN_EXPIRES),
+            # Carried in the claims so the refresh endpoint can mint a new
+            # access token without a user lookup
+            additional_claims={"username": user.username},
         )
         return refresh_token
 
@@ -46,24 +91,53 @@ class TokenHandler:
         """
         Invalidate a specific access token.
         """
-        token_entry = ActiveAccessToken.query.filter_by(access_token=token).first()
-        if token_entry:
-            db.session.delete(token_entry)
+        # One DELETE ... RETURNING replaces the SELECT + row delete pair
+        row = db.session.execute(
+            delete(ActiveAccessToken)
+            .where(ActiveAccessToken.access_token == token)
+            .returning(ActiveAccessToken.user_id)
+        ).first()
+        if row:
             db.session.commit()
+            # Tombstone the mirror (not delete: a retrying insert task
+            # must still see the revocation), drop the set entry and the
+            # cached user in the same round-trip
+            pipe = tombstone_token_mirrors([token])
+            pipe.srem(_user_tokens_key(row.user_id), token)
+            pipe.delete(_user_cache_key(row.user_id))
+            pipe.execute()
             logger.info(
-                f"Logout successfully and Invalidated token for user: {token_entry.user.username}"
+                "Logout successfully and Invalidated token for user: %s", row.user_id
             )
+        else:
+            db.session.rollback()
+            # The insert is deferred to the store_active_token task, so a
+            # logout can legitimately race it and find no row yet; the
+            # tombstone kills the mirror now and blocks the late insert
+            tombstone_token_mirrors([token]).execute()
+            logger.info("Invalidated token with no stored row (insert pending)")
 
     @staticmethod
     def invalidate_user_access_tokens(user_id):
         """
         Invalidate all active tokens for a given user.
         """
-        tokens = ActiveAccessToken.query.filter_by(user_id=user_id).all()
-        for token in tokens:
-            db.session.delete(token)
+        # The per-user set covers every token issued within the JWT TTL,
+        # including ones whose deferred insert has not landed; union it
+        # with the DELETE ... RETURNING rows and tombstone them all so no
+        # mirror survives and no late insert re-persists a revoked token
+        issued = redis_client.smembers(_user_tokens_key(user_id))
+        rows = db.session.execute(
+            delete(ActiveAccessToken)
+            .where(ActiveAccessToken.user_id == user_id)
+            .returning(ActiveAccessToken.access_token)
+        ).all()
         db.session.commit()
-        logger.info(f"Invalidated all tokens for user: {user_id}")
+        tokens = {row.access_token for row in rows} | issued
+        pipe = tombstone_token_mirrors(tokens)
+        pipe.delete(_user_tokens_key(user_id), _user_cache_key(user_id))
+        pipe.execute()
+        logger.info("Invalidated all tokens for user: %s", user_id)
 
     @staticmethod
     def generate_password_reset_token():
@@ -74,12 +148,16 @@ class TokenHandler:
     def store_reset_token(user_id, token):  # 15 minutes default
         """Store a password reset token in Redis with expiration."""
         key = f"password_reset:{token}"
-        redis_client.setex(key, PASSWORD_RESET_LINK_VALIDITY, str(user_id))
-
-        # Also store a rate limiting key to prevent too many requests
         rate_limit_key = f"password_reset_link_rate_limit:{user_id}"
-        if not redis_client.exists(rate_limit_key):
-            redis_client.setex(rate_limit_key, PASSWORD_RESET_LINK_SEND_RATE_LIMIT, "1")
+
+        # Pipeline both writes into one round-trip; SET NX replaces the
+        # separate EXISTS check for the rate limiting key
+        with redis_client.pipeline(transaction=False) as pipe:
+            pipe.setex(key, PASSWORD_RESET_LINK_VALIDITY, str(user_id))
+            pipe.set(
+                rate_limit_key, "1", ex=PASSWORD_RESET_LINK_SEND_RATE_LIMIT, nx=True
+            )
+            pipe.execute()
 
     @staticmethod
     def verify_reset_token(token):
@@ -0,0 +1,13 @@
+from flask import current_app
+
+
+def external_url(path):
+    """
+    Build an absolute URL for links embedded in outgoing emails.
+
+    url_for(..., _external=True) resolves the werkzeug routing map and the
+    request context on every call; email link paths are fixed, so joining
+    the configured base with an f-string is equivalent and much cheaper.
+    """
+    base = current_app.config["EXTERNAL_BASE_URL"]
+    return f"{base}/{path.lstrip('/')}"
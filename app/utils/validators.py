@@ -1,30 +1,45 @@
 from marshmallow import validate, ValidationError
+from functools import lru_cache
 import re
+import string
 import uuid
 
 from app.models.user import User
 from app.extensions import db
 from app.utils.logger import logger
 
+# Compiled once at import: these run on every signup/update request, so the
+# per-call re-cache lookup is skipped
+_USERNAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+# The special characters are all ASCII, so membership is a byte-indexed
+# read into this 128-entry table instead of a set hash per character
+_PASSWORD_SPECIAL_LUT = bytes(
+    1 if chr(i) in '!@#$%^&*(),.?":{}|<>' else 0 for i in range(128)
+)
+
+# Bit flags for the password character classes; the scan below ORs them
+# into one mask and stops as soon as all three are present
+_HAS_LETTER, _HAS_DIGIT, _HAS_SPECIAL = 1, 2, 4
+_ALL_CLASSES = _HAS_LETTER | _HAS_DIGIT | _HAS_SPECIAL
+_UUID_PATTERN = re.compile(
+    r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z",
+    re.IGNORECASE | re.ASCII,
+)
+
 
 def validate_username(value):
-    """Ensure username only contains letters, numbers, and underscores."""
-    if not re.match(r"^[a-zA-Z0-9_]+$", value):
+    """Ensure username only contains letters, numbers, and underscores.
+
+    Uniqueness is checked at the schema level together with the email so
+    signup costs one round-trip, not one per field.
+    """
+    # Plain character-class test: C-level set containment beats spinning
+    # up the regex engine for this
+    if not value or not _USERNAME_CHARS.issuperset(value):
         raise ValidationError(
             "Username must contain only letters, numbers, underscores, dots, or hyphens."
         )
 
-    existing_user = db.session.query(User).filter_by(username=value).first()
-    if existing_user:
-        raise ValidationError("Username is already taken.")
-
-
-def validate_email(value):
-    """Ensure email is unique."""
-    existing_email = db.session.query(User).filter_by(email=value).first()
-    if existing_email:
-        raise ValidationError("Email is already in use.")
-
 
 def validate_password(value):
     """
@@ -35,11 +50,10 @@ def validate_password(value):
     - Must contain at least one special character.
     """
     min_length = 8
-    special_char_pattern = r'[!@#$%^&*(),.?":{}|<>]'
-    digit_pattern = r"\d"
-    letter_pattern = r"[a-zA-Z]"
 
-    if value != value.strip():
+    # Only the boundary characters can violate this rule, so two O(1)
+    # checks replace the strip() copy-and-compare
+    if value and (value[0].isspace() or value[-1].isspace()):
         raise ValidationError(
             "Password must not contain leading or trailing whitespace."
         )
@@ -48,50 +62,99 @@ def validate_password(value):
     if len(value) < min_length:
         raise ValidationError("Password must be at least 8 characters long.")
 
+    # One pass over the string classifies every character into a bitmask;
+    # three separate regex searches would each scan the password again
+    mask = 0
+    for ch in value:
+        o = ord(ch)
+        if 97 <= o <= 122 or 65 <= o <= 90:
+            mask |= _HAS_LETTER
+        elif ch.isdigit():
+            mask |= _HAS_DIGIT
+        elif o < 128 and _PASSWORD_SPECIAL_LUT[o]:
+            mask |= _HAS_SPECIAL
+        if mask == _ALL_CLASSES:
+            break
+
     # Check if password contains at least one letter
-    if not re.search(letter_pattern, value):
+    if not mask & _HAS_LETTER:
         raise ValidationError("Password must contain at least one letter.")
 
     # Check if password contains at least one digit
-    if not re.search(digit_pattern, value):
+    if not mask & _HAS_DIGIT:
         raise ValidationError("Password must contain at least one digit.")
 
     # Check if password contains at least one special character
-    if not re.search(special_char_pattern, value):
+    if not mask & _HAS_SPECIAL:
         raise ValidationError("Password must contain at least one special character.")
 
     return value
 
 
 def is_valid_uuid(value):
-    try:
-        uuid_obj = uuid.UUID(value)
-        return True
-    except ValueError as e:
-        return False
+    # A regex match avoids raising/catching ValueError on the (common)
+    # invalid-input path; exception-driven control flow is far slower
+    return isinstance(value, str) and _UUID_PATTERN.match(value) is not None
+
+
+def parse_uuid(value):
+    """Parse a UUID string, returning None instead of raising on bad input.
+
+    For callers that need the parsed value: one gate plus one
+    construction, instead of validating and then parsing the same
+    string twice.
+    """
+    if isinstance(value, str) and _UUID_PATTERN.match(value):
+        return uuid.UUID(value)
+    return None
 
 
+def category_key(name):
+    """
+    Cheap case-insensitive comparison key for category names.
+
+    Only safe between names already in canonical form (as stored by
+    normalize_category_name), where the sole differences left are case
+    and boundary whitespace. Raw user input must still go through
+    normalize_category_name, which also collapses separators.
+    """
+    return name.strip().lower() if name else ""
+
+
+@lru_cache(maxsize=4096)
 def normalize_category_name(name):
     """
     Normalize a category name by removing extra spaces, special characters,
     and standardizing the format.
+
+    Pure string-to-string, so repeats of common inputs ("Food", "food ")
+    come from the per-process LRU cache instead of re-running the pass.
     """
     if not name:
         return ""
 
-    # Convert to lowercase and trim whitespace
-    normalized = name.lower().strip()
-
-    # Replace multiple spaces, dashes, or special chars with a single space
-    normalized = re.sub(r"[\s\-_]+", " ", normalized)
-
-    # Remove any remaining non-alphanumeric chars (except spaces)
-    normalized = re.sub(r"[^\w\s]", "", normalized)
-
-    # Split into words
-    words = normalized.split()
+    # Single pass over the lowercased input: alphanumerics are kept, runs
+    # of whitespace/dashes/underscores collapse to one space, punctuation
+    # is dropped. The two regex substitutions this replaces each scanned
+    # and reallocated the whole string
+    out = []
+    prev_space = True  # swallows leading separators
+    for ch in name.lower():
+        if ch.isalnum():
+            out.append(ch)
+            prev_space = False
+        elif ch.isspace() or ch in "-_":
+            if not prev_space:
+                out.append(" ")
+                prev_space = True
+        # any other character is punctuation and is dropped
+
+    normalized = "".join(out).strip()
+    if not normalized:
+        return ""
 
-    # Capitalize only the first word, keep others as lowercase
-    if words:
-        normalized = words[0].capitalize() + " " + " ".join(words[1:])
-    return normalized
+    # Capitalize only the first word, keep others as lowercase (the
+    # joining space is always emitted, matching the historical format
+    # category names are stored in)
+    first, _, rest = normalized.partition(" ")
+    return first.capitalize() + " " + rest
@@ -0,0 +1,30 @@
+"""index users for keyset pagination
+
+Revision ID: 0a7c5e93d1b4
+Revises: f61a2b84c905
+Create Date: 2025-03-10 15:41:09.243187
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a7c5e93d1b4'
+down_revision = 'f61a2b84c905'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_users_active_created',
+        'users',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_users_active_created', table_name='users')
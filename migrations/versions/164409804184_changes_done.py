@@ -17,30 +17,31 @@ depends_on = None
 
 
 def upgrade():
-    # ### commands auto generated by Alembic - please adjust! ###
-    with op.batch_alter_table('categories', schema=None) as batch_op:
-        batch_op.drop_constraint('categories_user_id_fkey', type_='foreignkey')
-        batch_op.create_foreign_key(None, 'users', ['user_id'], ['id'], ondelete='CASCADE')
-
-    with op.batch_alter_table('transactions', schema=None) as batch_op:
-        batch_op.drop_constraint('transactions_category_id_fkey', type_='foreignkey')
-        batch_op.drop_constraint('transactions_user_id_fkey', type_='foreignkey')
-        batch_op.create_foreign_key(None, 'users', ['user_id'], ['id'], ondelete='CASCADE')
-        batch_op.create_foreign_key(None, 'categories', ['category_id'], ['id'], ondelete='CASCADE')
-
-    # ### end Alembic commands ###
+    # Direct DDL instead of batch_alter_table: on Postgres these are
+    # metadata-only constraint swaps. Naming the new FKs explicitly
+    # (Postgres's own default names) keeps downgrade symmetric; the
+    # autogenerated version created them unnamed and could not drop
+    # them again.
+    op.drop_constraint('categories_user_id_fkey', 'categories', type_='foreignkey')
+    op.create_foreign_key('categories_user_id_fkey', 'categories', 'users',
+                          ['user_id'], ['id'], ondelete='CASCADE')
+
+    op.drop_constraint('transactions_category_id_fkey', 'transactions', type_='foreignkey')
+    op.drop_constraint('transactions_user_id_fkey', 'transactions', type_='foreignkey')
+    op.create_foreign_key('transactions_user_id_fkey', 'transactions', 'users',
+                          ['user_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key('transactions_category_id_fkey', 'transactions', 'categories',
+                          ['category_id'], ['id'], ondelete='CASCADE')
 
 
 def downgrade():
-    # ### commands auto generated by Alembic - please adjust! ###
-    with op.batch_alter_table('transactions', schema=None) as batch_op:
-        batch_op.drop_constraint(None, type_='foreignkey')
-        batch_op.drop_constraint(None, type_='foreignkey')
-        batch_op.create_foreign_key('transactions_user_id_fkey', 'users', ['user_id'], ['id'])
-        batch_op.create_foreign_key('transactions_category_id_fkey', 'categories', ['category_id'], ['id'])
-
-    with op.batch_alter_table('categories', schema=None) as batch_op:
-        batch_op.drop_constraint(None, type_='foreignkey')
-        batch_op.create_foreign_key('categories_user_id_fkey', 'users', ['user_id'], ['id'])
-
-    # ### end Alembic commands ###
+    op.drop_constraint('transactions_category_id_fkey', 'transactions', type_='foreignkey')
+    op.drop_constraint('transactions_user_id_fkey', 'transactions', type_='foreignkey')
+    op.create_foreign_key('transactions_user_id_fkey', 'transactions', 'users',
+                          ['user_id'], ['id'])
+    op.create_foreign_key('transactions_category_id_fkey', 'transactions', 'categories',
+                          ['category_id'], ['id'])
+
+    op.drop_constraint('categories_user_id_fkey', 'categories', type_='foreignkey')
+    op.create_foreign_key('categories_user_id_fkey', 'categories', 'users',
+                          ['user_id'], ['id'])
@@ -0,0 +1,26 @@
+"""index active tokens by user
+
+Revision ID: 1b9e4d72a6c3
+Revises: 0a7c5e93d1b4
+Create Date: 2025-03-10 16:18:52.604471
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b9e4d72a6c3'
+down_revision = '0a7c5e93d1b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_active_tokens_user', 'active_access_tokens', ['user_id'], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_active_tokens_user', table_name='active_access_tokens')
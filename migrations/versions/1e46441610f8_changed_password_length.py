@@ -17,22 +17,16 @@ depends_on = None
 
 
 def upgrade():
-    # ### commands auto generated by Alembic - please adjust! ###
-    with op.batch_alter_table('users', schema=None) as batch_op:
-        batch_op.alter_column('password',
-               existing_type=sa.VARCHAR(length=120),
-               type_=sa.String(length=255),
-               existing_nullable=False)
-
-    # ### end Alembic commands ###
+    # Plain ALTER COLUMN; widening a varchar is metadata-only on Postgres
+    # and needs none of batch_alter_table's copy-and-rename machinery
+    op.alter_column('users', 'password',
+                    existing_type=sa.VARCHAR(length=120),
+                    type_=sa.String(length=255),
+                    existing_nullable=False)
 
 
 def downgrade():
-    # ### commands auto generated by Alembic - please adjust! ###
-    with op.batch_alter_table('users', schema=None) as batch_op:
-        batch_op.alter_column('password',
-               existing_type=sa.String(length=255),
-               type_=sa.VARCHAR(length=120),
-               existing_nullable=False)
-
-    # ### end Alembic commands ###
+    op.alter_column('users', 'password',
+                    existing_type=sa.String(length=255),
+                    type_=sa.VARCHAR(length=120),
+                    existing_nullable=False)
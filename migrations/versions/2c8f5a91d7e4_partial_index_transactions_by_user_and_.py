@@ -0,0 +1,30 @@
+"""partial index transactions by user and category
+
+Revision ID: 2c8f5a91d7e4
+Revises: 1b9e4d72a6c3
+Create Date: 2025-03-10 17:05:26.331942
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2c8f5a91d7e4'
+down_revision = '1b9e4d72a6c3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_transactions_user_category',
+        'transactions',
+        ['user_id', 'category_id'],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_transactions_user_category', table_name='transactions')
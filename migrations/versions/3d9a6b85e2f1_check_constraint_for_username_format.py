@@ -0,0 +1,28 @@
+"""check constraint for username format
+
+Revision ID: 3d9a6b85e2f1
+Revises: 2c8f5a91d7e4
+Create Date: 2025-03-11 10:22:41.184756
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3d9a6b85e2f1'
+down_revision = '2c8f5a91d7e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_check_constraint(
+        'username_format',
+        'users',
+        "username ~ '^[A-Za-z0-9_]+$'",
+    )
+
+
+def downgrade():
+    op.drop_constraint('username_format', 'users', type_='check')
@@ -0,0 +1,29 @@
+"""index active tokens by created_at
+
+Revision ID: 4e7c2a85b9d1
+Revises: 3d9a6b85e2f1
+Create Date: 2025-03-12 09:41:17.523908
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e7c2a85b9d1'
+down_revision = '3d9a6b85e2f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_active_tokens_created_at',
+        'active_access_tokens',
+        ['created_at'],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_active_tokens_created_at', table_name='active_access_tokens')
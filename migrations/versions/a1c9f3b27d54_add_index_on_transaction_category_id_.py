@@ -0,0 +1,28 @@
+"""add index on transaction category_id and is_deleted
+
+Revision ID: a1c9f3b27d54
+Revises: 8f04acdd0a0a
+Create Date: 2025-03-10 10:42:18.204913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c9f3b27d54'
+down_revision = '8f04acdd0a0a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_tx_category_active', ['category_id', 'is_deleted'], unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.drop_index('ix_tx_category_active')
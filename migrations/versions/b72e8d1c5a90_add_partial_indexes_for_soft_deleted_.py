@@ -0,0 +1,38 @@
+"""add partial indexes for soft deleted filtering
+
+Revision ID: b72e8d1c5a90
+Revises: a1c9f3b27d54
+Create Date: 2025-03-10 11:08:37.551246
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b72e8d1c5a90'
+down_revision = 'a1c9f3b27d54'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_transactions_active',
+        'transactions',
+        ['user_id', sa.text('date_time DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+    op.create_index(
+        'ix_categories_active',
+        'categories',
+        ['user_id'],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_categories_active', table_name='categories')
+    op.drop_index('ix_transactions_active', table_name='transactions')
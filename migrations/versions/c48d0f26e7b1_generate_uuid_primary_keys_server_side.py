@@ -0,0 +1,32 @@
+"""generate uuid primary keys server side
+
+Revision ID: c48d0f26e7b1
+Revises: b72e8d1c5a90
+Create Date: 2025-03-10 12:31:09.887312
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c48d0f26e7b1'
+down_revision = 'b72e8d1c5a90'
+branch_labels = None
+depends_on = None
+
+TABLES = ('users', 'categories', 'transactions', 'active_access_tokens')
+
+
+def upgrade():
+    # gen_random_uuid() is built in from Postgres 13; enable pgcrypto on
+    # older versions before running this migration
+    for table in TABLES:
+        op.alter_column(
+            table, 'id', server_default=sa.text('gen_random_uuid()')
+        )
+
+
+def downgrade():
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
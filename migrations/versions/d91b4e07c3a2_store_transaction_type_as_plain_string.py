@@ -0,0 +1,41 @@
+"""store transaction type as plain string
+
+Revision ID: d91b4e07c3a2
+Revises: c48d0f26e7b1
+Create Date: 2025-03-10 14:02:51.330478
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd91b4e07c3a2'
+down_revision = 'c48d0f26e7b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column(
+        'transactions',
+        'type',
+        type_=sa.String(length=6),
+        postgresql_using='type::text',
+    )
+    op.create_check_constraint(
+        'ck_transactions_type', 'transactions', "type IN ('credit', 'debit')"
+    )
+    op.execute('DROP TYPE transactiontype')
+
+
+def downgrade():
+    op.drop_constraint('ck_transactions_type', 'transactions', type_='check')
+    transactiontype = sa.Enum('credit', 'debit', name='transactiontype')
+    transactiontype.create(op.get_bind())
+    op.alter_column(
+        'transactions',
+        'type',
+        type_=transactiontype,
+        postgresql_using='type::transactiontype',
+    )
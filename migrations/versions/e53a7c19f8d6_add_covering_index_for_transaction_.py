@@ -0,0 +1,32 @@
+"""add covering index for transaction reports
+
+Revision ID: e53a7c19f8d6
+Revises: d91b4e07c3a2
+Create Date: 2025-03-10 14:27:44.119805
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e53a7c19f8d6'
+down_revision = 'd91b4e07c3a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # INCLUDE needs Postgres 11+
+    op.create_index(
+        'ix_transactions_report',
+        'transactions',
+        ['user_id', 'date_time'],
+        unique=False,
+        postgresql_include=['type', 'amount', 'category_id'],
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_transactions_report', table_name='transactions')
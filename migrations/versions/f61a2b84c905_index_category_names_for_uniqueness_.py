@@ -0,0 +1,30 @@
+"""index category names for uniqueness probes
+
+Revision ID: f61a2b84c905
+Revises: e53a7c19f8d6
+Create Date: 2025-03-10 15:02:31.887214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f61a2b84c905'
+down_revision = 'e53a7c19f8d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_categories_user_name',
+        'categories',
+        ['user_id', 'name'],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_categories_user_name', table_name='categories')